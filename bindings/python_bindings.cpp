@@ -1,5 +1,6 @@
 #include <pybind11/pybind11.h>
 #include <pybind11/stl.h> // Needed for automatic conversion of std::vector, etc.
+#include <stdexcept>
 #include "../src/core.h"
 #include "../src/solution.h"
 #include "../src/branch_bound_solver.h"
@@ -90,11 +91,47 @@ PYBIND11_MODULE(_solver, m) {
         }, py::arg("constraint_index"), py::arg("var_index"), py::arg("coeff"))
         .def("set_variable_bounds", [](MIPSolver::Problem &p, int v_idx, double lower, double upper) {
             p.getVariable(v_idx).setBounds(lower, upper);
-        }, py::arg("var_index"), py::arg("lower"), py::arg("upper"));
+        }, py::arg("var_index"), py::arg("lower"), py::arg("upper"))
+        // Batch setters: add a whole group of variables or coefficients in one Python/C++ call
+        .def("add_variables", [](MIPSolver::Problem &p, const std::vector<std::string> &names,
+                                 const std::vector<MIPSolver::VariableType> &types,
+                                 const std::vector<double> &lower, const std::vector<double> &upper) {
+            if (types.size() != names.size() || lower.size() != names.size() || upper.size() != names.size()) {
+                throw std::invalid_argument("names, types, lower and upper must have the same length");
+            }
+            int first = p.getNumVariables();
+            for (size_t i = 0; i < names.size(); ++i) {
+                int v_idx = p.addVariable(names[i], types[i]);
+                p.getVariable(v_idx).setBounds(lower[i], upper[i]);
+            }
+            return first;
+        }, py::arg("names"), py::arg("types"), py::arg("lower"), py::arg("upper"),
+           "Adds variables in order and returns the index of the first one.")
+        .def("set_objective_coefficients", [](MIPSolver::Problem &p, const std::vector<int> &var_indices,
+                                              const std::vector<double> &coeffs) {
+            if (coeffs.size() != var_indices.size()) {
+                throw std::invalid_argument("var_indices and coeffs must have the same length");
+            }
+            for (size_t i = 0; i < var_indices.size(); ++i) {
+                p.setObjectiveCoefficient(var_indices[i], coeffs[i]);
+            }
+        }, py::arg("var_indices"), py::arg("coeffs"))
+        .def("add_constraint_coefficients", [](MIPSolver::Problem &p, int c_idx, const std::vector<int> &var_indices,
+                                               const std::vector<double> &coeffs) {
+            if (coeffs.size() != var_indices.size()) {
+                throw std::invalid_argument("var_indices and coeffs must have the same length");
+            }
+            MIPSolver::Constraint &constraint = p.getConstraint(c_idx);
+            for (size_t i = 0; i < var_indices.size(); ++i) {
+                constraint.addVariable(var_indices[i], coeffs[i]);
+            }
+        }, py::arg("constraint_index"), py::arg("var_indices"), py::arg("coeffs"));
 
     // Bind the Solver class
     py::class_<MIPSolver::BranchBoundSolver>(m, "Solver")
         .def(py::init<>())
         .def("set_verbose", &MIPSolver::BranchBoundSolver::setVerbose, py::arg("verbose"))
-        .def("solve", &MIPSolver::BranchBoundSolver::solve, py::arg("problem"), "Solves the given optimization problem.");
+        // solve() is pure C++; release the GIL so other Python threads can solve in parallel
+        .def("solve", &MIPSolver::BranchBoundSolver::solve, py::arg("problem"), "Solves the given optimization problem.",
+             py::call_guard<py::gil_scoped_release>());
 }
@@ -3,33 +3,124 @@
 MIPSolver 简单API服务器
 """
 import json
+import itertools
+import secrets
+import threading
 from datetime import datetime
-from typing import Dict, Any
-import uuid
+from typing import Dict, Any, List, Optional
 
 try:
-    from flask import Flask, request, jsonify, render_template_string
+    from flask import Flask, Response, request, jsonify
+    from flask.json.provider import DefaultJSONProvider
     from flask_cors import CORS
 except ImportError:
     print("请安装Flask: pip install flask flask-cors")
     exit(1)
 
+try:
+    # asgiref为可选依赖，用于在Uvicorn等ASGI服务器下运行
+    from asgiref.wsgi import WsgiToAsgi
+except ImportError:
+    WsgiToAsgi = None
+
+try:
+    # orjson为可选依赖，未安装时回退到Flask默认的标准库json
+    import orjson
+except ImportError:
+    orjson = None
+
 try:
     import mipsolver as mp
 except ImportError as e:
     print(f"MIPSolver导入失败: {e}")
     exit(1)
 
+
+class OrjsonProvider(DefaultJSONProvider):
+    """使用orjson序列化响应、解析请求体的JSON提供器"""
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode('utf-8')
+
+    def loads(self, s, **kwargs):
+        # request.get_json() 经由 app.json.loads 解析请求体
+        return orjson.loads(s)
+
+
 app = Flask(__name__)
-CORS(app)
+if orjson is not None:
+    app.json = OrjsonProvider(app)
+# 浏览器缓存预检(OPTIONS)结果24小时，避免每个跨域POST都先发一次预检
+CORS(app, resources={r'/api/*': {'origins': '*', 'max_age': 86400}})
+
+# ASGI入口: uvicorn api_server:asgi_app --host 0.0.0.0 --port 8080 --workers N
+asgi_app = WsgiToAsgi(app) if WsgiToAsgi is not None else None
+
+# 变量类型名称到求解器常量的映射
+VARIABLE_TYPES = {
+    'continuous': mp.CONTINUOUS,
+    'integer': mp.INTEGER,
+    'binary': mp.BINARY
+}
+
+# 约束方向到约束构造方式的映射
+CONSTRAINT_SENSES = {
+    '<=': lambda expr, rhs: expr <= rhs,
+    '>=': lambda expr, rhs: expr >= rhs,
+    '==': lambda expr, rhs: expr == rhs
+}
 
 # 全局存储
-active_models: Dict[str, Dict] = {}
+# 模型ID为"<槽位下标>-<随机后缀>"：下标直接定位预分配槽位，随机后缀防止其他客户端猜出ID
+# 删除模型后槽位进入空闲列表，新建模型时优先复用；只有同时存在的模型数达到上限时才拒绝创建
+MODEL_CAPACITY = 65536
+_model_ids = itertools.count()
+active_models: List[Optional[Dict]] = [None] * MODEL_CAPACITY
+_free_slots: List[int] = []
+_slots_lock = threading.Lock()
 
-@app.route('/')
-def index():
-    """API文档"""
-    html = """
+
+def allocate_slot() -> Optional[int]:
+    """分配一个空槽位，已无空槽位时返回None"""
+    with _slots_lock:
+        if _free_slots:
+            return _free_slots.pop()
+    index = next(_model_ids)
+    return index if index < MODEL_CAPACITY else None
+
+
+def release_model(model_id: str) -> bool:
+    """删除模型并释放其槽位，返回模型是否存在"""
+    with _slots_lock:
+        if get_model_data(model_id) is None:
+            return False
+        index = int(model_id.partition('-')[0])
+        active_models[index] = None
+        _free_slots.append(index)
+    return True
+
+
+def get_model_data(model_id: str) -> Optional[Dict]:
+    """按模型ID取出模型数据，ID无效、后缀不匹配或模型不存在时返回None"""
+    index, sep, _ = model_id.partition('-')
+    # isdecimal只接受0-9等十进制数字，'²'之类的字符会被isdigit接受但int()无法转换
+    if not sep or not index.isdecimal():
+        return None
+    index = int(index)
+    if index >= MODEL_CAPACITY:
+        return None
+    model_data = active_models[index]
+    if model_data is None or not secrets.compare_digest(model_data['id'].encode(), model_id.encode()):
+        return None
+    return model_data
+
+def get_json_object() -> Optional[Dict]:
+    """读取请求体中的JSON对象；请求体缺失、不是合法JSON或不是对象时返回None"""
+    data = request.get_json(silent=True)
+    return data if isinstance(data, dict) else None
+
+# API文档页面模板在导入时编译并渲染一次
+INDEX_HTML = """
     <!DOCTYPE html>
     <html>
     <head><title>MIPSolver API 文档</title></head>
@@ -40,7 +131,9 @@ def index():
         <p>添加变量: POST /api/models/{id}/variables</p> 
         <p>设置目标: POST /api/models/{id}/objective</p>
         <p>添加约束: POST /api/models/{id}/constraints</p>
+        <p>批量添加约束系数: POST /api/models/{id}/constraints/{cid}/coefficients</p>
         <p>求解: POST /api/models/{id}/solve</p>
+        <p>删除模型: DELETE /api/models/{id}</p>
         
         <h2>示例</h2>
         <pre>
@@ -50,30 +143,55 @@ curl -X POST http://localhost:8080/api/models -H "Content-Type: application/json
 # 添加变量  
 curl -X POST http://localhost:8080/api/models/{model_id}/variables -H "Content-Type: application/json" -d '{"name": "x", "type": "integer"}'
 
+# 添加约束 x + 2y <= 10
+curl -X POST http://localhost:8080/api/models/{model_id}/constraints -H "Content-Type: application/json" -d '{"name": "c1", "sense": "<=", "rhs": 10, "coefs": [["x", 1]]}'
+
+# 批量追加约束系数
+curl -X POST http://localhost:8080/api/models/{model_id}/constraints/{cid}/coefficients -H "Content-Type: application/json" -d '{"coefs": [["y", 2]]}'
+
 # 求解
 curl -X POST http://localhost:8080/api/models/{model_id}/solve
+
+# 删除模型
+curl -X DELETE http://localhost:8080/api/models/{model_id}
         </pre>
     </body>
     </html>
     """
-    return render_template_string(html)
+_INDEX_TEMPLATE = app.jinja_env.from_string(INDEX_HTML)
+_INDEX_BYTES = _INDEX_TEMPLATE.render().encode('utf-8')
+
+@app.route('/')
+def index():
+    """API文档"""
+    return Response(_INDEX_BYTES, mimetype='text/html')
 
 @app.route('/api/models', methods=['POST'])
 def create_model():
     """创建模型"""
     try:
-        data = request.get_json()
+        data = get_json_object()
+        if data is None:
+            return jsonify({'success': False, 'error': '请求体必须是JSON对象'}), 400
         name = data.get('name', 'api_model')
-        model_id = str(uuid.uuid4())
+        if not isinstance(name, str):
+            return jsonify({'success': False, 'error': '模型名必须是字符串'}), 400
+        index = allocate_slot()
+        if index is None:
+            return jsonify({'success': False, 'error': '模型数量已达上限'}), 503
+        model_id = f"{index}-{secrets.token_hex(8)}"
         
         model_data = {
             'id': model_id,
             'name': name,
             'model': mp.Model(name),
             'variables': {},
+            'var_names': [],  # 按添加顺序排列，与model.get_values()一一对应
+            'constraints': [],
+            'dirty': True,  # 模型自上次求解后是否被修改
             'created_at': datetime.now().isoformat()
         }
-        active_models[model_id] = model_data
+        active_models[index] = model_data
         
         return jsonify({
             'success': True,
@@ -84,29 +202,38 @@ def create_model():
     except Exception as e:
         return jsonify({'success': False, 'error': str(e)}), 500
 
+@app.route('/api/models/<model_id>', methods=['DELETE'])
+def delete_model(model_id):
+    """删除模型，释放的槽位供之后创建的模型复用"""
+    if not release_model(model_id):
+        return jsonify({'success': False, 'error': '模型不存在'}), 404
+    return jsonify({'success': True})
+
 @app.route('/api/models/<model_id>/variables', methods=['POST']) 
 def add_variable(model_id):
     """添加变量"""
     try:
-        if model_id not in active_models:
+        model_data = get_model_data(model_id)
+        if model_data is None:
             return jsonify({'success': False, 'error': '模型不存在'}), 404
             
-        data = request.get_json()
+        data = get_json_object()
+        if data is None:
+            return jsonify({'success': False, 'error': '请求体必须是JSON对象'}), 400
         name = data.get('name')
         vtype = data.get('type', 'continuous')
         
-        if not name:
+        if not name or not isinstance(name, str):
             return jsonify({'success': False, 'error': '变量名不能为空'}), 400
             
-        type_map = {
-            'continuous': mp.CONTINUOUS,
-            'integer': mp.INTEGER,
-            'binary': mp.BINARY
-        }
+        var_type = VARIABLE_TYPES.get(vtype) if isinstance(vtype, str) else None
+        if var_type is None:
+            return jsonify({'success': False, 'error': f'不支持的变量类型: {vtype}'}), 400
         
-        model_data = active_models[model_id]
-        var = model_data['model'].add_var(name=name, vtype=type_map[vtype], lb=0)
+        var = model_data['model'].add_var(name=name, vtype=var_type, lb=0)
         model_data['variables'][name] = var
+        model_data['var_names'].append(name)
+        model_data['dirty'] = True
         
         return jsonify({
             'success': True,
@@ -116,28 +243,136 @@ def add_variable(model_id):
     except Exception as e:
         return jsonify({'success': False, 'error': str(e)}), 500
 
+def apply_coefficients(model_data: Dict, expr, coefs) -> Optional[str]:
+    """将[[变量名, 系数], ...]批量加入表达式，出错时返回错误信息且不修改表达式"""
+    if not isinstance(coefs, list):
+        return 'coefs必须是[[变量名, 系数], ...]格式的列表'
+    variables = model_data['variables']
+    terms = []
+    for item in coefs:
+        if not isinstance(item, list) or len(item) != 2:
+            return f'系数项格式错误，应为[变量名, 系数]: {item}'
+        name, coeff = item
+        var = variables.get(name) if isinstance(name, str) else None
+        if var is None:
+            return f'变量不存在: {name}'
+        try:
+            terms.append((float(coeff), var))
+        except (TypeError, ValueError):
+            return f'系数不是数值: {coeff}'
+    
+    for coeff, var in terms:
+        expr.add_term(coeff, var)
+    return None
+
+@app.route('/api/models/<model_id>/constraints', methods=['POST'])
+def add_constraint(model_id):
+    """添加约束"""
+    try:
+        model_data = get_model_data(model_id)
+        if model_data is None:
+            return jsonify({'success': False, 'error': '模型不存在'}), 404
+            
+        data = get_json_object()
+        if data is None:
+            return jsonify({'success': False, 'error': '请求体必须是JSON对象'}), 400
+        sense = data.get('sense', '<=')
+        
+        make_constraint = CONSTRAINT_SENSES.get(sense) if isinstance(sense, str) else None
+        if make_constraint is None:
+            return jsonify({'success': False, 'error': f'不支持的约束类型: {sense}'}), 400
+        
+        rhs = data.get('rhs', 0.0)
+        try:
+            rhs = float(rhs)
+        except (TypeError, ValueError):
+            return jsonify({'success': False, 'error': f'右端常数不是数值: {rhs}'}), 400
+        
+        name = data.get('name', '')
+        if not isinstance(name, str):
+            return jsonify({'success': False, 'error': '约束名必须是字符串'}), 400
+        
+        expr = mp.LinExpr()
+        error = apply_coefficients(model_data, expr, data.get('coefs', []))
+        if error:
+            return jsonify({'success': False, 'error': error}), 400
+        
+        constraint = model_data['model'].add_constr(make_constraint(expr, rhs), name)
+        constraint_id = str(len(model_data['constraints']))
+        model_data['constraints'].append(constraint)
+        model_data['dirty'] = True
+        
+        return jsonify({
+            'success': True,
+            'constraint_id': constraint_id,
+            'name': constraint.name
+        }), 201
+        
+    except Exception as e:
+        return jsonify({'success': False, 'error': str(e)}), 500
+
+@app.route('/api/models/<model_id>/constraints/<constraint_id>/coefficients', methods=['POST'])
+def add_constraint_coefficients(model_id, constraint_id):
+    """批量添加约束系数，一次请求处理全部系数"""
+    try:
+        model_data = get_model_data(model_id)
+        if model_data is None:
+            return jsonify({'success': False, 'error': '模型不存在'}), 404
+        
+        constraints = model_data['constraints']
+        if not constraint_id.isdecimal() or int(constraint_id) >= len(constraints):
+            return jsonify({'success': False, 'error': '约束不存在'}), 404
+            
+        data = get_json_object()
+        if data is None:
+            return jsonify({'success': False, 'error': '请求体必须是JSON对象'}), 400
+        coefs = data.get('coefs', [])
+        
+        error = apply_coefficients(model_data, constraints[int(constraint_id)].lhs, coefs)
+        if error:
+            return jsonify({'success': False, 'error': error}), 400
+        model_data['dirty'] = True
+        
+        return jsonify({
+            'success': True,
+            'message': f'已添加 {len(coefs)} 个系数'
+        })
+        
+    except Exception as e:
+        return jsonify({'success': False, 'error': str(e)}), 500
+
 @app.route('/api/models/<model_id>/solve', methods=['POST'])
 def solve_model(model_id):
     """求解模型"""
     try:
-        if model_id not in active_models:
+        model_data = get_model_data(model_id)
+        if model_data is None:
             return jsonify({'success': False, 'error': '模型不存在'}), 404
             
-        model_data = active_models[model_id]
         model = model_data['model']
         
+        # 模型未修改时直接返回上次的求解结果
+        if not model_data['dirty'] and 'cached_result' in model_data:
+            return jsonify({
+                'success': True,
+                'result': model_data['cached_result']
+            })
+        
         model.optimize()
         
+        optimal = getattr(model, 'status', None) == mp.OPTIMAL
         result = {
-            'status': 'optimal' if hasattr(model, 'status') and model.status == mp.OPTIMAL else 'unknown',
+            'status': 'optimal' if optimal else 'unknown',
             'variables': {},
             'objective_value': None
         }
         
-        if hasattr(model, 'status') and model.status == mp.OPTIMAL:
+        if optimal:
             result['objective_value'] = model.obj_val
-            for name, var in model_data['variables'].items():
-                result['variables'][name] = var.value
+            result['variables'] = dict(zip(model_data['var_names'], model.get_values()))
+        
+        model_data['cached_result'] = result
+        model_data['dirty'] = False
                 
         return jsonify({
             'success': True,
@@ -153,8 +388,20 @@ if __name__ == '__main__':
     parser.add_argument('--host', default='0.0.0.0')
     parser.add_argument('--port', type=int, default=8080)
     parser.add_argument('--debug', action='store_true')
+    parser.add_argument('--asgi', action='store_true', help='使用Uvicorn ASGI服务器运行')
     
     args = parser.parse_args()
     
     print(f"启动 MIPSolver API 服务器: http://{args.host}:{args.port}")
-    app.run(host=args.host, port=args.port, debug=args.debug)
\ No newline at end of file
+    if args.asgi:
+        try:
+            import uvicorn
+        except ImportError:
+            print("请安装Uvicorn: pip install uvicorn asgiref")
+            exit(1)
+        if asgi_app is None:
+            print("请安装asgiref: pip install asgiref")
+            exit(1)
+        uvicorn.run(asgi_app, host=args.host, port=args.port)
+    else:
+        app.run(host=args.host, port=args.port, debug=args.debug)
\ No newline at end of file
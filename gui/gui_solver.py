@@ -25,10 +25,14 @@ MIPSolver GUI界面
 """
 import sys
 import os
+import io
 import json
+import queue
+import string
 import tempfile
 import subprocess
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
 from typing import Dict, Any, Optional
@@ -42,9 +46,10 @@ except ImportError:
     print("请安装tkinter: pip install tkinter")
     sys.exit(1)
 
+from mps_reader import build_model, load_mps
+
 # 尝试导入MIPSolver核心模块
 try:
-    import mipsolver as mp
     from mipsolver import Model, CONTINUOUS, INTEGER, BINARY, MAXIMIZE, MINIMIZE
     print("MIPSolver导入成功")
     HAS_MIPSOLVER = True
@@ -58,6 +63,282 @@ except ImportError as e:
     MAXIMIZE = -1
     MINIMIZE = 1
 
+try:
+    # numpy为可选依赖，用于大规模求解结果的批量类型分类
+    import numpy as np
+except ImportError:
+    np = None
+
+# 模拟模型的求解耗时（秒），默认不等待；开发调试界面时可通过环境变量设置
+try:
+    _MOCK_DELAY = float(os.environ.get("MIPSOLVER_MOCK_DELAY", "0"))
+except ValueError:
+    print("MIPSOLVER_MOCK_DELAY不是数值，忽略")
+    _MOCK_DELAY = 0.0
+
+# 求解状态值到状态文本的映射
+_STATUS_MAP = {
+    1: "UNKNOWN",
+    2: "OPTIMAL",
+    3: "INFEASIBLE",
+    4: "UNBOUNDED",
+    5: "ERROR"
+}
+
+def format_values(values):
+    """把取值批量格式化为6位小数的字符串"""
+    return [f"{value:.6f}" for value in values]
+
+
+# 后台任务（文件加载、求解、报告生成）执行期间的轮询间隔（毫秒）
+BACKGROUND_POLL_MS = 50
+
+# 鼠标滚轮每格滚动变量值表格的行数
+VALUES_WHEEL_ROWS = 3
+
+# 按取值推断的变量类型标签（用于报告）
+TYPE_BINARY = "二进制"
+TYPE_INTEGER = "整数"
+TYPE_CONTINUOUS = "连续"
+
+
+def classify_values(values):
+    """
+    根据取值推断每个变量可能的类型
+
+    取值为整数且在[0, 1]内视为二进制，其余整数值视为整数，否则为连续；
+    返回 (与values等长的类型标签列表, {类型标签: 数量})
+    """
+    if np is not None:
+        arr = np.fromiter(values, dtype=np.float64, count=len(values))
+        is_int = np.abs(arr - np.round(arr)) < 1e-9
+        is_bin = is_int & (arr >= 0) & (arr <= 1)
+        types = np.where(is_bin, TYPE_BINARY, np.where(is_int, TYPE_INTEGER, TYPE_CONTINUOUS)).tolist()
+        binary_count = int(is_bin.sum())
+        integer_count = int(is_int.sum()) - binary_count
+        return types, {
+            TYPE_BINARY: binary_count,
+            TYPE_INTEGER: integer_count,
+            TYPE_CONTINUOUS: len(types) - binary_count - integer_count
+        }
+    
+    types = []
+    append = types.append
+    counts = {TYPE_BINARY: 0, TYPE_INTEGER: 0, TYPE_CONTINUOUS: 0}
+    for value in values:
+        if abs(value - round(value)) < 1e-9:
+            var_type = TYPE_BINARY if 0 <= value <= 1 else TYPE_INTEGER
+        else:
+            var_type = TYPE_CONTINUOUS
+        append(var_type)
+        counts[var_type] += 1
+    return types, counts
+
+
+# LaTeX特殊字符的转义表，一次str.translate完成全部替换
+_LATEX_ESCAPES = str.maketrans({
+    '&': r'\&', '%': r'\%', '$': r'\$', '#': r'\#', '_': r'\_',
+    '{': r'\{', '}': r'\}', '\\': r'\textbackslash{}',
+    '^': r'\^{}', '~': r'\~{}',
+})
+
+
+def tex_escape(text):
+    """转义文本中的LaTeX特殊字符，用于写入报告的求解器名、变量名等"""
+    return text.translate(_LATEX_ESCAPES)
+
+
+# LaTeX报告的导言区和开头部分，只有生成时间随每次报告变化
+_LATEX_PREAMBLE = string.Template(r"""
+\documentclass[12pt,a4paper]{article}
+\usepackage{xeCJK}
+\usepackage{amsmath}
+\usepackage{amsfonts}
+\usepackage{amssymb}
+\usepackage{geometry}
+\usepackage{booktabs}
+\usepackage{array}
+\usepackage{longtable}
+\usepackage{graphicx}
+\usepackage{xcolor}
+\usepackage{fancyhdr}
+
+% 设置页面边距
+\geometry{margin=2.5cm}
+
+% 设置中文字体 (使用系统字体)
+\setCJKmainfont{PingFang SC}  % macOS系统字体
+\setCJKsansfont{PingFang SC}
+\setCJKmonofont{PingFang SC}
+
+% 如果系统没有PingFang SC，可以使用其他中文字体
+% \setCJKmainfont{SimSun}  % Windows
+% \setCJKmainfont{Noto Sans CJK SC}  % Linux
+
+% 设置页眉页脚
+\pagestyle{fancy}
+\fancyhf{}
+\fancyhead[L]{MIPSolver 求解报告}
+\fancyhead[R]{$time}
+\fancyfoot[C]{\thepage}
+
+% 标题设置
+\title{\textbf{MIPSolver 混合整数规划求解报告}}
+\author{系统自动生成}
+\date{$time}
+
+\begin{document}
+
+\maketitle
+\thispagestyle{fancy}
+
+\tableofcontents
+\newpage
+
+\section{问题概述}
+""")
+
+
+# 数学模型一节与求解结果无关，为固定文本
+_LATEX_MATH_SECTION = r"""
+\subsection{数学模型}
+
+本问题为混合整数线性规划问题，数学模型如下：
+
+\begin{align}
+\text{目标函数：} \quad & \min \sum_{j=1}^{n} c_j x_j \label{eq:objective}\\
+\text{约束条件：} \quad & \sum_{j=1}^{n} a_{ij} x_j \leq b_i, \quad i = 1, 2, \ldots, m \label{eq:constraints}\\
+& x_j \geq 0, \quad j = 1, 2, \ldots, n \label{eq:nonnegativity}\\
+& x_j \in \mathbb{Z}, \quad j \in I \label{eq:integrality}
+\end{align}
+
+其中：
+\begin{itemize}
+\item $x_j$ 为决策变量，$j = 1, 2, \ldots, n$
+\item $c_j$ 为目标函数系数
+\item $a_{ij}$ 为约束系数矩阵元素
+\item $b_i$ 为约束右端常数
+\item $I$ 为整数变量的指标集合
+\end{itemize}
+"""
+
+# 报告结尾的总结与技术说明，只有统计数字和生成时间随报告变化
+_LATEX_SUMMARY = string.Template(r"""
+\section{总结与结论}
+
+\subsection{求解总结}
+
+本次优化求解任务已成功完成，主要成果如下：
+
+\begin{enumerate}
+\item \textbf{问题建模：}成功构建了包含 $var_count 个决策变量和 $constraint_count 个约束的混合整数线性规划模型
+\item \textbf{算法求解：}采用高性能C++实现的分支定界算法，确保求解的准确性与效率
+\item \textbf{最优解获得：}在 $solve_time 秒内找到最优解，目标函数值为 $objective_value
+\item \textbf{解的验证：}所有约束条件均得到满足，整数约束得到严格执行
+\end{enumerate}
+
+\subsection{技术说明}
+
+\begin{itemize}
+\item \textbf{软件平台：}MIPSolver v1.0 - 基于Python和C++的混合整数规划求解器
+\item \textbf{求解引擎：}自主研发的高性能C++优化核心
+\item \textbf{报告生成：}支持XeLaTeX格式，完美呈现中文内容
+\item \textbf{生成时间：}$time
+\end{itemize}
+
+\vspace{1cm}
+
+\begin{center}
+\textit{--- 报告结束 ---}
+
+\small{此报告由 MIPSolver 系统自动生成}
+\end{center}
+
+\end{document}
+""")
+
+
+# XeLaTeX编译说明模板
+_COMPILE_INSTRUCTIONS = string.Template(r"""XeLaTeX 编译说明
+===============================
+
+文件：$tex_filename
+生成时间：$current_time
+
+一、系统要求
+-----------
+1. 安装完整的LaTeX发行版：
+   - macOS: MacTeX (推荐)
+   - Windows: MiKTeX 或 TeX Live
+   - Linux: TeX Live
+
+2. 确保已安装XeLaTeX：
+   打开终端/命令提示符，运行：xelatex --version
+
+3. 中文字体要求：
+   - macOS: 系统自带 PingFang SC 字体
+   - Windows: 需要安装中文字体（如 SimSun）
+   - Linux: 安装 fonts-noto-cjk 包
+
+二、编译方法
+-----------
+
+方法一：命令行编译（推荐）
+1. 打开终端/命令提示符
+2. 切换到文件所在目录：cd "文件目录路径"
+3. 运行编译命令：
+   xelatex "$tex_filename"
+4. 如果包含目录，再次运行：
+   xelatex "$tex_filename"
+
+方法二：LaTeX编辑器
+1. 使用 TeXworks, TeXstudio, VS Code 等编辑器
+2. 打开 .tex 文件
+3. 设置编译器为 XeLaTeX
+4. 点击编译按钮
+
+三、故障排除
+-----------
+
+问题1：找不到字体
+解决：
+- macOS: 确保系统已安装 PingFang SC
+- Windows: 将第689行改为 \setCJKmainfont{SimSun}
+- Linux: 将第689行改为 \setCJKmainfont{Noto Sans CJK SC}
+
+问题2：编译错误
+解决：
+1. 检查 LaTeX 发行版是否完整安装
+2. 更新宏包：tlmgr update --self --all
+3. 检查文件路径中是否包含特殊字符
+
+问题3：中文显示异常
+解决：
+1. 确保使用 XeLaTeX 而非 pdfLaTeX
+2. 检查中文字体是否正确安装
+3. 确认文件编码为 UTF-8
+
+四、预期输出
+-----------
+成功编译后将生成：
+- $pdf_name - 最终PDF报告
+- $aux_name - 辅助文件
+- $log_name - 编译日志
+- $toc_name - 目录文件
+
+五、技术支持
+-----------
+如遇问题，请检查：
+1. LaTeX 发行版版本和完整性
+2. XeLaTeX 编译器可用性
+3. 中文字体安装情况
+4. 文件编码格式（应为UTF-8）
+
+生成工具：MIPSolver v1.0
+技术文档：https://github.com/your-repo/mipsolver
+""")
+
+
 class MIPSolverGUI:
     """
     MIPSolver图形用户界面主类
@@ -92,6 +373,16 @@ class MIPSolverGUI:
         self.model = None              # 当前优化模型
         self.solution = None           # 当前求解结果
         self.problem_data = {}         # 问题数据缓存
+        self._var_names = []           # 求解结果变量名（按列存放）
+        self._var_values = []          # 求解结果变量取值，与_var_names一一对应
+        self._var_types = []           # 按取值推断的变量类型，与_var_names一一对应
+        self._var_type_counts = {}     # 各推断类型的变量数量
+        self._var_formatted = []       # 格式化后的变量取值，与_var_names一一对应
+        self._value_rows = []          # 变量值表格的全部行（预先格式化）
+        self._values_top = 0           # 变量值表格首个可见行在_value_rows中的下标
+        self._values_visible = 20      # 变量值表格可容纳的行数，随窗口大小更新
+        self._report_sections = {}     # 已生成的报告各节文本
+        self._report_cache_owner = None  # 报告各节缓存对应的 (solution, model, 约束数)
         
         # 求解器选项配置
         # 这里定义了可用的求解算法及其对应的后端实现
@@ -100,6 +391,11 @@ class MIPSolverGUI:
             "Simplex (LP)": "mipsolver"     # 单纯形法（仅用于线性规划松弛）
         }
         
+        # 文件加载、求解和报告生成共用一个常驻后台线程，避免阻塞Tk事件循环
+        # （C++求解期间释放GIL）；后台任务通过队列向界面回传进度
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="mipsolver-worker")
+        self._progress_queue = queue.Queue()
+        
         # 初始化用户界面
         self.setup_ui()
         
@@ -192,13 +488,13 @@ class MIPSolverGUI:
             rb.pack(anchor=tk.W, pady=2)
         
         # 求解按钮
-        solve_btn = ttk.Button(
+        self.solve_btn = ttk.Button(
             upload_frame, 
             text="开始求解", 
             command=self.solve_problem,
             style='Accent.TButton'
         )
-        solve_btn.pack(pady=20)
+        self.solve_btn.pack(pady=20)
         
         # 进度条
         self.progress_var = tk.DoubleVar()
@@ -296,11 +592,19 @@ class MIPSolverGUI:
         values_frame = ttk.LabelFrame(solution_frame, text="变量取值", padding=10)
         values_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
         
+        # 虚拟化显示：表格只保留可见的行，滚动时按位置从_value_rows重新填充
+        self.values_scroll = ttk.Scrollbar(values_frame, orient=tk.VERTICAL, command=self._scroll_values)
+        self.values_scroll.pack(side=tk.RIGHT, fill=tk.Y)
+        
         self.values_tree = ttk.Treeview(values_frame, columns=("variable", "value", "type"), show="headings")
         self.values_tree.heading("variable", text="变量名")
         self.values_tree.heading("value", text="取值")
         self.values_tree.heading("type", text="类型")
         self.values_tree.pack(fill=tk.BOTH, expand=True)
+        self.values_tree.bind("<Configure>", self._on_values_resize)
+        self.values_tree.bind("<MouseWheel>", self._on_values_wheel)
+        self.values_tree.bind("<Button-4>", self._on_values_wheel)
+        self.values_tree.bind("<Button-5>", self._on_values_wheel)
         
     def setup_report_tab(self, notebook):
         """报告生成标签页"""
@@ -321,7 +625,8 @@ class MIPSolverGUI:
         ttk.Checkbutton(options_frame, text="包含问题分析", variable=self.include_analysis_var).pack(anchor=tk.W)
         
         # 生成报告按钮
-        ttk.Button(report_frame, text="生成LaTeX报告", command=self.generate_latex_report).pack(pady=10)
+        self.report_btn = ttk.Button(report_frame, text="生成LaTeX报告", command=self.generate_latex_report)
+        self.report_btn.pack(pady=10)
         
         # 报告预览
         preview_frame = ttk.LabelFrame(report_frame, text="报告预览", padding=10)
@@ -345,13 +650,20 @@ class MIPSolverGUI:
             self.load_problem_file(filename)
             
     def load_problem_file(self, filename):
-        """加载问题文件"""
+        """加载问题文件：在后台线程解析，解析进度经队列回传"""
+        self.status_var.set("正在加载文件...")
+        self.progress_var.set(20)
+        self.solve_btn.configure(state=tk.DISABLED)
+        
+        # 解析MPS文件
+        future = self._executor.submit(self.parse_mps_file, filename, self._progress_queue.put)
+        self._poll_future(future, self._finish_load)
+        
+    def _finish_load(self, future):
+        """文件解析完成后在Tk线程中更新模型和界面"""
+        self.solve_btn.configure(state=tk.NORMAL)
         try:
-            self.status_var.set("正在加载文件...")
-            self.progress_var.set(20)
-            
-            # 解析MPS文件
-            self.model = self.parse_mps_file(filename)
+            self.model = future.result()
             
             self.status_var.set("文件加载完成")
             self.progress_var.set(100)
@@ -360,8 +672,31 @@ class MIPSolverGUI:
             messagebox.showerror("错误", f"加载文件失败: {e}")
             self.status_var.set("文件加载失败")
             
-    def parse_mps_file(self, filename):
-        """解析MPS文件"""
+    def _poll_future(self, future, on_done, on_wait=None):
+        """
+        在Tk事件循环中轮询后台任务
+        
+        等待期间把进度队列中的最新值显示到进度条，并调用on_wait；
+        任务完成后在Tk线程中调用on_done(future)
+        """
+        progress = None
+        while True:
+            try:
+                progress = self._progress_queue.get_nowait()
+            except queue.Empty:
+                break
+        if progress is not None:
+            self.progress_var.set(progress)
+        
+        if not future.done():
+            if on_wait is not None:
+                on_wait()
+            self.root.after(BACKGROUND_POLL_MS, self._poll_future, future, on_done, on_wait)
+            return
+        on_done(future)
+            
+    def parse_mps_file(self, filename, progress=None):
+        """解析MPS文件；progress(百分比)用于汇报解析进度，可在后台线程中调用"""
         if not HAS_MIPSOLVER:
             # 如果没有MIPSolver，创建模拟模型
             return self.create_mock_model()
@@ -372,133 +707,11 @@ class MIPSolverGUI:
             print(f"Model创建失败: {e}")
             return self.create_mock_model()
         
-        # 简单的MPS解析器
-        with open(filename, 'r') as f:
-            lines = f.readlines()
-        
-        current_section = None
-        variables = {}
-        constraints = {}
-        objective = None
-        objective_sense = MINIMIZE
-        in_int_section = False  # 新增：是否在整数变量区间
-        
-        for line_num, line in enumerate(lines, 1):
-            line = line.strip()
-            if not line or line.startswith('*'):
-                continue
-                
-            if line == 'NAME':
-                current_section = 'NAME'
-            elif line == 'ROWS':
-                current_section = 'ROWS'
-            elif line == 'COLUMNS':
-                current_section = 'COLUMNS'
-            elif line == 'RHS':
-                current_section = 'RHS'
-            elif line == 'BOUNDS':
-                current_section = 'BOUNDS'
-            elif line == 'ENDATA':
-                break
-            elif current_section == 'ROWS':
-                # 解析行（约束和目标）
-                parts = line.split()
-                if len(parts) >= 2:
-                    row_type = parts[0]
-                    row_name = parts[1]
-                    
-                    if row_type == 'N':
-                        # 目标函数行
-                        objective = row_name
-                    else:
-                        # 约束行
-                        constraints[row_name] = {
-                            'type': row_type,
-                            'coefficients': {},
-                            'rhs': 0.0
-                        }
-            elif current_section == 'COLUMNS':
-                parts = line.split()
-                if len(parts) >= 3:
-                    var_name = parts[0]
-                    # 检查整数变量标记
-                    if var_name == 'MARK' and len(parts) > 3:
-                        marker = parts[3].strip("'")
-                        if marker == 'INTORG':
-                            in_int_section = True
-                        elif marker == 'INTEND':
-                            in_int_section = False
-                        continue
-                    vtype = INTEGER if in_int_section else CONTINUOUS
-                    # 跳过特殊标记行（如MARK, MARKEND等）
-                    if var_name in ['MARK', 'MARKEND']:
-                        continue
-                    if var_name not in variables:
-                        try:
-                            variables[var_name] = model.add_var(name=var_name, vtype=vtype)
-                        except Exception as e:
-                            print(f"添加变量失败: {e}")
-                            continue
-                    row_name = parts[1]
-                    # 安全地转换系数为浮点数
-                    try:
-                        coeff_str = parts[2]
-                        # 检查是否是字符串值（用引号包围）
-                        if coeff_str.startswith("'") and coeff_str.endswith("'"):
-                            print(f"警告: 第{line_num}行跳过字符串值: {coeff_str}")
-                            continue
-                        coeff = float(coeff_str)
-                    except (ValueError, IndexError) as e:
-                        print(f"警告: 第{line_num}行系数转换失败: '{parts[2] if len(parts) > 2 else 'N/A'}' - {e}")
-                        continue
-                    if row_name == objective:
-                        # 目标函数系数
-                        try:
-                            variables[var_name].obj = coeff
-                        except Exception as e:
-                            print(f"设置目标系数失败: {e}")
-                    else:
-                        # 约束系数
-                        if row_name in constraints:
-                            constraints[row_name]['coefficients'][var_name] = coeff
-            elif current_section == 'RHS':
-                # 解析右端常数
-                parts = line.split()
-                if len(parts) >= 3:
-                    row_name = parts[1]
-                    # 安全地转换RHS为浮点数
-                    try:
-                        rhs_str = parts[2]
-                        # 检查是否是字符串值（用引号包围）
-                        if rhs_str.startswith("'") and rhs_str.endswith("'"):
-                            print(f"警告: 第{line_num}行跳过字符串RHS: {rhs_str}")
-                            continue
-                        rhs = float(rhs_str)
-                    except (ValueError, IndexError) as e:
-                        print(f"警告: 第{line_num}行RHS转换失败: '{parts[2] if len(parts) > 2 else 'N/A'}' - {e}")
-                        continue
-                    if row_name in constraints:
-                        constraints[row_name]['rhs'] = rhs
-        # 设置目标函数
-        if objective:
-            try:
-                obj_expr = sum(var.obj * var for var in variables.values() if hasattr(var, 'obj'))
-                model.set_objective(obj_expr, objective_sense)
-            except Exception as e:
-                print(f"设置目标函数失败: {e}")
-        # 添加约束
-        for constr_name, constr_data in constraints.items():
-            try:
-                lhs = sum(constr_data['coefficients'].get(var_name, 0) * variables[var_name] 
-                         for var_name in variables.keys())
-                if constr_data['type'] == 'L':
-                    model.add_constr(lhs <= constr_data['rhs'], name=constr_name)
-                elif constr_data['type'] == 'G':
-                    model.add_constr(lhs >= constr_data['rhs'], name=constr_name)
-                elif constr_data['type'] == 'E':
-                    model.add_constr(lhs == constr_data['rhs'], name=constr_name)
-            except Exception as e:
-                print(f"添加约束失败: {e}")
+        # 解析结果按文件内容缓存在磁盘上，同一文件再次导入时跳过解析
+        parsed = load_mps(filename)
+        if progress is not None:
+            progress(50)
+        build_model(model, parsed)
         return model
         
     def create_mock_model(self):
@@ -512,8 +725,9 @@ class MIPSolverGUI:
                 self._constraints = []
             
             def optimize(self):
-                # 模拟求解过程
-                time.sleep(1)
+                # 模拟求解过程；仅在设置了MIPSOLVER_MOCK_DELAY时模拟耗时
+                if _MOCK_DELAY:
+                    time.sleep(_MOCK_DELAY)
                 self.status = "OPTIMAL"
                 self.obj_val = 20.0
                 # 设置模拟的变量值
@@ -538,73 +752,109 @@ class MIPSolverGUI:
                 self.obj = 0.0
                 self.vtype = CONTINUOUS
             
+            # 表达式运算统一返回共享的占位表达式，避免逐项创建对象
             def __mul__(self, other):
-                return MockExpr()
+                return mock_expr
             
             def __add__(self, other):
-                return MockExpr()
+                return mock_expr
             
             def __rmul__(self, other):
-                return MockExpr()
+                return mock_expr
             
             def __radd__(self, other):
-                return MockExpr()
+                return mock_expr
         
         class MockExpr:
             def __init__(self):
                 pass
             
+            def __mul__(self, other):
+                return self
+            
+            def __add__(self, other):
+                return self
+            
+            def __rmul__(self, other):
+                return self
+            
+            def __radd__(self, other):
+                return self
+            
             def __le__(self, other):
-                return MockConstraint()
+                return mock_constraint
             
             def __ge__(self, other):
-                return MockConstraint()
+                return mock_constraint
             
             def __eq__(self, other):
-                return MockConstraint()
+                return mock_constraint
         
         class MockConstraint:
             def __init__(self):
                 pass
         
+        mock_expr = MockExpr()
+        mock_constraint = MockConstraint()
+        
         return MockModel("mock_model")
         
     def solve_problem(self):
-        """求解问题"""
+        """求解问题：提交到后台线程，并在Tk事件循环中轮询结果"""
         if not self.model:
             messagebox.showwarning("警告", "请先加载问题文件")
             return
             
+        # 显示正在求解状态
+        solver_name = self.solver_var.get()
+        self.status_var.set(f"正在使用 {solver_name} 求解...")
+        self.progress_var.set(30)
+        self.solve_btn.configure(state=tk.DISABLED)
+        
+        model = self.model
+        
+        def show_solve_progress():
+            # 求解器提供日志时，按日志条数推进进度条
+            log_len = len(getattr(model, 'solve_log', ()))
+            self.progress_var.set(min(90, 30 + log_len))
+        
+        future = self._executor.submit(self._optimize_timed, model)
+        self._poll_future(future, lambda f: self._finish_solve(f, model, solver_name), show_solve_progress)
+        
+    @staticmethod
+    def _optimize_timed(model):
+        """在后台线程中调用求解器，返回求解耗时（秒）"""
+        start_ns = time.perf_counter_ns()
+        model.optimize()
+        return (time.perf_counter_ns() - start_ns) * 1e-9
+        
+    def _finish_solve(self, future, model, solver_name):
+        """后台求解完成后在Tk线程中整理结果并更新界面"""
+        self.solve_btn.configure(state=tk.NORMAL)
         try:
-            # 显示正在求解状态
-            solver_name = self.solver_var.get()
-            self.status_var.set(f"正在使用 {solver_name} 求解...")
-            self.progress_var.set(30)
-            
-            # 记录开始时间
-            start_time = time.time()
-            
-            # 调用求解器
-            self.model.optimize()
-            
-            # 记录求解时间
-            solve_time = time.time() - start_time
+            solve_time = future.result()
             
             # 提取求解结果
             self.solution = {
-                'status': self.get_status_text(self.model.status),
-                'objective_value': self.model.obj_val if hasattr(self.model, 'obj_val') else 0.0,
+                'status': self.get_status_text(model.status),
+                'objective_value': model.obj_val if hasattr(model, 'obj_val') else 0.0,
                 'variables': {},
                 'solve_time': solve_time,
-                'iterations': self.model.iterations if hasattr(self.model, 'iterations') else 0,
-                'solve_log': self.model.solve_log if hasattr(self.model, 'solve_log') else [],
-                'solver': self.solver_var.get()
+                'iterations': model.iterations if hasattr(model, 'iterations') else 0,
+                'solve_log': model.solve_log if hasattr(model, 'solve_log') else [],
+                'solver': solver_name
             }
             
             # 提取变量值
-            for var in getattr(self.model, '_variables', []):
+            for var in getattr(model, '_variables', []):
                 self.solution['variables'][var.name] = getattr(var, 'value', 0.0)
             
+            # 按列保存变量名、取值和推断类型，显示和报告各部分直接复用
+            self._var_names = list(self.solution['variables'].keys())
+            self._var_values = list(self.solution['variables'].values())
+            self._var_types, self._var_type_counts = classify_values(self._var_values)
+            self._var_formatted = format_values(self._var_values)
+            
             self.progress_var.set(100)
             self.status_var.set("求解完成")
             
@@ -620,20 +870,13 @@ class MIPSolverGUI:
     def get_status_text(self, status):
         """获取状态文本"""
         # Handle different status representations
-        if hasattr(status, 'name'):
-            return status.name
-        elif hasattr(status, 'value'):
-            status_value = status.value
-            status_map = {
-                2: "OPTIMAL",
-                3: "INFEASIBLE", 
-                4: "UNBOUNDED",
-                5: "ERROR",
-                1: "UNKNOWN"
-            }
-            return status_map.get(status_value, "UNKNOWN")
-        else:
-            return str(status)
+        name = getattr(status, 'name', None)
+        if name is not None:
+            return name
+        status_value = getattr(status, 'value', None)
+        if status_value is not None:
+            return _STATUS_MAP.get(status_value, "UNKNOWN")
+        return str(status)
         
     def add_variable(self):
         """添加变量"""
@@ -701,19 +944,111 @@ class MIPSolverGUI:
         self.solution_info_text.delete(1.0, tk.END)
         self.solution_info_text.insert(1.0, info_text)
         
-        # 更新变量值表格
-        self.values_tree.delete(*self.values_tree.get_children())
-        for var_name, value in self.solution['variables'].items():
-            self.values_tree.insert("", "end", values=(var_name, f"{value:.6f}", "continuous"))
+        # 更新变量值表格：先构造好全部行，表格中只填充当前可见的部分
+        self._value_rows = [(var_name, value_text, "continuous")
+                            for var_name, value_text in zip(self._var_names, self._var_formatted)]
+        self._values_top = 0
+        self._render_values()
+        
+    def _render_values(self):
+        """按当前滚动位置填充变量值表格的可见行，并同步滚动条"""
+        tree = self.values_tree
+        total = len(self._value_rows)
+        top = max(0, min(self._values_top, total - self._values_visible))
+        self._values_top = top
+        rows = self._value_rows[top:top + self._values_visible]
+        
+        # 复用已有条目，只增删数量差
+        items = tree.get_children()
+        for iid, row in zip(items, rows):
+            tree.item(iid, values=row)
+        if len(items) > len(rows):
+            tree.delete(*items[len(rows):])
+        for row in rows[len(items):]:
+            tree.insert("", "end", values=row)
+        
+        if total:
+            self.values_scroll.set(top / total, (top + len(rows)) / total)
+        else:
+            self.values_scroll.set(0, 1)
+            
+    def _scroll_values(self, *args):
+        """滚动条回调：("moveto", 比例) 或 ("scroll", 数量, "units"/"pages")"""
+        if args[0] == "moveto":
+            self._values_top = int(float(args[1]) * len(self._value_rows))
+        elif args[0] == "scroll":
+            step = self._values_visible if args[2] == "pages" else 1
+            self._values_top += int(args[1]) * step
+        self._render_values()
+        
+    def _on_values_wheel(self, event):
+        """鼠标滚轮滚动变量值表格（Windows/macOS为MouseWheel，Linux为Button-4/5）"""
+        direction = -1 if event.num == 4 or event.delta > 0 else 1
+        self._scroll_values("scroll", direction * VALUES_WHEEL_ROWS, "units")
+        return "break"
+        
+    def _on_values_resize(self, event):
+        """表格尺寸变化时重新计算可容纳的行数"""
+        items = self.values_tree.get_children()
+        bbox = self.values_tree.bbox(items[0]) if items else None
+        if bbox:
+            header_height, row_height = bbox[1], bbox[3]
+        else:
+            row_height = Font(name="TkDefaultFont", exists=True).metrics("linespace") + 4
+            header_height = row_height
+        visible = max(1, (event.height - header_height) // row_height)
+        if visible != self._values_visible:
+            self._values_visible = visible
+            self._render_values()
             
     def generate_latex_report(self):
         """生成LaTeX报告"""
         if not self.solution:
             messagebox.showwarning("警告", "请先求解问题")
             return
-            
+        
+        # 选项在Tk线程中读取，报告内容在后台线程中生成
+        options = {
+            'math': self.include_math_var.get(),
+            'solution': self.include_solution_var.get(),
+            'analysis': self.include_analysis_var.get()
+        }
+        # 报告与编译说明共用同一生成时间
+        generated_at = datetime.now()
+        # 报告所需数据同样在Tk线程中取快照，后台生成期间界面修改模型或重新加载不影响报告
+        report = self._report_snapshot()
+        # 报告生成并保存完之前不允许重复提交，避免连点弹出多个保存对话框
+        self.report_btn.configure(state=tk.DISABLED)
+        future = self._executor.submit(self.create_latex_report, options, generated_at, report)
+        self._poll_future(future, lambda f: self._finish_report(f, generated_at, report))
+        
+    def _report_snapshot(self):
+        """在Tk线程中收集生成报告所需的数据；各节缓存复制一份，由后台线程填充"""
+        constraint_count = len(getattr(self.model, '_constraints', ()))
+        owner = (self.solution, self.model, constraint_count)
+        cached = self._report_cache_owner
+        same = (cached is not None and cached[0] is owner[0] and cached[1] is owner[1]
+                and cached[2] == constraint_count)
+        return {
+            'owner': owner,
+            'sections': dict(self._report_sections) if same else {},
+            'solution': self.solution,
+            'constraint_count': constraint_count,
+            'var_names': self._var_names,
+            'var_formatted': self._var_formatted,
+            'var_types': self._var_types,
+            'var_type_counts': self._var_type_counts
+        }
+    
+    def _finish_report(self, future, generated_at=None, report=None):
+        """报告生成完成后在Tk线程中预览并保存"""
         try:
-            latex_content = self.create_latex_report()
+            latex_content = future.result()
+            
+            # 后台线程填充的各节缓存在Tk线程中写回，供切换选项后再次生成时复用
+            if report is not None:
+                self._report_cache_owner = report['owner']
+                self._report_sections = report['sections']
             
             # 显示在预览区域
             self.report_text.delete(1.0, tk.END)
@@ -731,7 +1066,7 @@ class MIPSolverGUI:
                     f.write(latex_content)
                 
                 # 创建编译说明文件
-                compile_instructions = self.create_compile_instructions(filename)
+                compile_instructions = self.create_compile_instructions(filename, generated_at)
                 instructions_file = filename.replace('.tex', '_编译说明.txt')
                 
                 with open(instructions_file, 'w', encoding='utf-8') as f:
@@ -752,87 +1087,72 @@ xelatex "{filename}"
                 
         except Exception as e:
             messagebox.showerror("错误", f"生成报告失败: {e}")
+        finally:
+            self.report_btn.configure(state=tk.NORMAL)
             
-    def create_latex_report(self):
-        """创建XeLaTeX报告内容（支持中文）"""
-        # 获取当前时间
-        from datetime import datetime
-        current_time = datetime.now().strftime("%Y年%m月%d日 %H:%M:%S")
-        
-        report = r"""
-\documentclass[12pt,a4paper]{article}
-\usepackage{xeCJK}
-\usepackage{amsmath}
-\usepackage{amsfonts}
-\usepackage{amssymb}
-\usepackage{geometry}
-\usepackage{booktabs}
-\usepackage{array}
-\usepackage{longtable}
-\usepackage{graphicx}
-\usepackage{xcolor}
-\usepackage{fancyhdr}
-
-% 设置页面边距
-\geometry{margin=2.5cm}
-
-% 设置中文字体 (使用系统字体)
-\setCJKmainfont{PingFang SC}  % macOS系统字体
-\setCJKsansfont{PingFang SC}
-\setCJKmonofont{PingFang SC}
-
-% 如果系统没有PingFang SC，可以使用其他中文字体
-% \setCJKmainfont{SimSun}  % Windows
-% \setCJKmainfont{Noto Sans CJK SC}  % Linux
-
-% 设置页眉页脚
-\pagestyle{fancy}
-\fancyhf{}
-\fancyhead[L]{MIPSolver 求解报告}
-\fancyhead[R]{""" + current_time + r"""}
-\fancyfoot[C]{\thepage}
-
-% 标题设置
-\title{\textbf{MIPSolver 混合整数规划求解报告}}
-\author{系统自动生成}
-\date{""" + current_time + r"""}
-
-\begin{document}
-
-\maketitle
-\thispagestyle{fancy}
-
-\tableofcontents
-\newpage
+    def create_latex_report(self, options=None, generated_at=None, report=None):
+        """
+        创建XeLaTeX报告内容（支持中文）
 
-\section{问题概述}
-"""
+        options为各节开关，缺省时读取界面选项；generated_at缺省为当前时间；
+        report为_report_snapshot的快照，在后台线程中调用时必须传入，缺省时在当前线程取快照
+        """
+        if report is None:
+            report = self._report_snapshot()
+        if options is None:
+            options = {
+                'math': self.include_math_var.get(),
+                'solution': self.include_solution_var.get(),
+                'analysis': self.include_analysis_var.get()
+            }
+        current_time = (generated_at or datetime.now()).strftime("%Y年%m月%d日 %H:%M:%S")
         
-        if self.include_math_var.get():
-            report += r"""
-\subsection{数学模型}
-
-本问题为混合整数线性规划问题，数学模型如下：
-
-\begin{align}
-\text{目标函数：} \quad & \min \sum_{j=1}^{n} c_j x_j \label{eq:objective}\\
-\text{约束条件：} \quad & \sum_{j=1}^{n} a_{ij} x_j \leq b_i, \quad i = 1, 2, \ldots, m \label{eq:constraints}\\
-& x_j \geq 0, \quad j = 1, 2, \ldots, n \label{eq:nonnegativity}\\
-& x_j \in \mathbb{Z}, \quad j \in I \label{eq:integrality}
-\end{align}
-
-其中：
-\begin{itemize}
-\item $x_j$ 为决策变量，$j = 1, 2, \ldots, n$
-\item $c_j$ 为目标函数系数
-\item $a_{ij}$ 为约束系数矩阵元素
-\item $b_i$ 为约束右端常数
-\item $I$ 为整数变量的指标集合
-\end{itemize}
-"""
+        buf = io.StringIO()
+        w = buf.write
+        w(_LATEX_PREAMBLE.substitute(time=current_time))
+        
+        if options['math']:
+            w(_LATEX_MATH_SECTION)
         
-        if self.include_solution_var.get():
-            report += r"""
+        if options['solution']:
+            w(self._report_section(report, 'solution', self._section_solution))
+        
+        if options['analysis']:
+            w(self._report_section(report, 'analysis', self._section_analysis))
+        
+        w(_LATEX_SUMMARY.substitute(self._report_section(report, 'fields', self._report_fields), time=current_time))
+        return buf.getvalue()
+    
+    @staticmethod
+    def _report_section(report, key, build):
+        """返回报告中的一节；同一求解结果和模型下各节只构建一次，切换选项后重新生成时直接复用"""
+        sections = report['sections']
+        section = sections.get(key)
+        if section is None:
+            section = sections[key] = build(report)
+        return section
+    
+    @staticmethod
+    def _report_fields(report):
+        """报告各处共用的数值，统一格式化一次"""
+        solution = report['solution']
+        return {
+            'status': solution['status'],
+            'objective_value': f"{solution['objective_value']:.6f}",
+            'solve_time': f"{solution['solve_time']:.4f}",
+            'iterations': str(solution['iterations']),
+            'solver_name': tex_escape(solution['solver']),
+            'var_count': str(len(solution['variables'])),
+            'constraint_count': str(report['constraint_count'])
+        }
+    
+    def _section_solution(self, report):
+        """报告：求解结果"""
+        fields = self._report_section(report, 'fields', self._report_fields)
+        buf = io.StringIO()
+        w = buf.write
+        writelines = buf.writelines
+        writelines((r"""
 \section{求解结果}
 
 \subsection{求解状态信息}
@@ -843,12 +1163,12 @@ xelatex "{filename}"
 \toprule
 \textbf{项目} & \textbf{结果} \\
 \midrule
-求解状态 & """ + self.solution['status'] + r""" \\
-目标函数值 & """ + f"{self.solution['objective_value']:.6f}" + r""" \\
-求解时间 & """ + f"{self.solution['solve_time']:.4f}" + r""" 秒 \\
-迭代次数 & """ + str(self.solution['iterations']) + r""" \\
-使用求解器 & """ + self.solution['solver'].replace('&', r'\&') + r""" \\
-变量数量 & """ + str(len(self.solution['variables'])) + r""" \\
+求解状态 & """, fields['status'], r""" \\
+目标函数值 & """, fields['objective_value'], r""" \\
+求解时间 & """, fields['solve_time'], r""" 秒 \\
+迭代次数 & """, fields['iterations'], r""" \\
+使用求解器 & """, fields['solver_name'], r""" \\
+变量数量 & """, fields['var_count'], r""" \\
 \bottomrule
 \end{tabular}
 \caption{求解状态信息汇总}
@@ -862,49 +1182,38 @@ xelatex "{filename}"
 \toprule
 \textbf{变量名} & \textbf{最优值} & \textbf{变量类型} \\
 \midrule
-"""
-            
-            # 只显示前20个变量，避免表格过长
-            var_items = list(self.solution['variables'].items())
-            display_vars = var_items[:20]
-            
-            for var_name, value in display_vars:
-                # 根据值判断可能的变量类型
-                if abs(value - round(value)) < 1e-9 and 0 <= value <= 1:
-                    var_type = "二进制"
-                elif abs(value - round(value)) < 1e-9:
-                    var_type = "整数"
-                else:
-                    var_type = "连续"
-                    
-                report += f"{var_name} & {value:.6f} & {var_type} \\\\\n"
+"""))
+        
+        # 只显示前20个变量，避免表格过长；类型为求解后按取值推断的结果
+        var_names = report['var_names']
+        num_vars = len(var_names)
+        rows = zip(map(tex_escape, var_names[:20]), report['var_formatted'][:20], report['var_types'][:20])
+        w("".join(f"{var_name} & {value_text} & {var_type} \\\\\n" for var_name, value_text, var_type in rows))
+        
+        if num_vars > 20:
+            writelines((r"""\midrule
+\multicolumn{3}{c}{\textit{... 省略其余 """, str(num_vars - 20), r""" 个变量 ...}} \\
+"""))
             
-            if len(var_items) > 20:
-                report += r"""\midrule
-\multicolumn{3}{c}{\textit{... 省略其余 """ + str(len(var_items) - 20) + r""" 个变量 ...}} \\
-"""
-                
-            report += r"""
+        w(r"""
 \bottomrule
 \caption{决策变量最优取值}
 \end{longtable}
-"""
-        
-        if self.include_analysis_var.get():
-            # 分析变量类型分布
-            binary_count = 0
-            integer_count = 0
-            continuous_count = 0
-            
-            for var_name, value in self.solution['variables'].items():
-                if abs(value - round(value)) < 1e-9 and 0 <= value <= 1:
-                    binary_count += 1
-                elif abs(value - round(value)) < 1e-9:
-                    integer_count += 1
-                else:
-                    continuous_count += 1
-            
-            report += r"""
+""")
+        return buf.getvalue()
+    
+    def _section_analysis(self, report):
+        """报告：问题分析"""
+        fields = self._report_section(report, 'fields', self._report_fields)
+        buf = io.StringIO()
+        writelines = buf.writelines
+        # 分析变量类型分布
+        var_type_counts = report['var_type_counts']
+        binary_count = var_type_counts.get(TYPE_BINARY, 0)
+        integer_count = var_type_counts.get(TYPE_INTEGER, 0)
+        continuous_count = var_type_counts.get(TYPE_CONTINUOUS, 0)
+        
+        writelines((r"""
 \section{问题分析}
 
 \subsection{问题规模分析}
@@ -915,11 +1224,11 @@ xelatex "{filename}"
 \toprule
 \textbf{问题特征} & \textbf{数量} \\
 \midrule
-决策变量总数 & """ + str(len(self.solution['variables'])) + r""" \\
-连续变量 & """ + str(continuous_count) + r""" \\
-整数变量 & """ + str(integer_count) + r""" \\
-二进制变量 & """ + str(binary_count) + r""" \\
-约束数量 & """ + str(len(getattr(self.model, '_constraints', []))) + r""" \\
+决策变量总数 & """, fields['var_count'], r""" \\
+连续变量 & """, str(continuous_count), r""" \\
+整数变量 & """, str(integer_count), r""" \\
+二进制变量 & """, str(binary_count), r""" \\
+约束数量 & """, fields['constraint_count'], r""" \\
 \bottomrule
 \end{tabular}
 \caption{问题规模统计}
@@ -928,149 +1237,40 @@ xelatex "{filename}"
 \subsection{求解器性能分析}
 
 \begin{itemize}
-\item \textbf{使用求解器：}""" + self.solution['solver'].replace('&', r'\&') + r"""
+\item \textbf{使用求解器：}""", fields['solver_name'], r"""
 \item \textbf{求解算法：}基于C++实现的分支定界法
 \item \textbf{线性松弛：}单纯形法
-\item \textbf{求解效率：}""" + f"{self.solution['solve_time']:.4f}" + r"""秒完成求解
-\item \textbf{迭代收敛：}经过""" + str(self.solution['iterations']) + r"""次迭代达到最优解
+\item \textbf{求解效率：}""", fields['solve_time'], r"""秒完成求解
+\item \textbf{迭代收敛：}经过""", fields['iterations'], r"""次迭代达到最优解
 \end{itemize}
 
 \subsection{解的质量评估}
 
-根据求解状态 \textbf{""" + self.solution['status'] + r"""}，可以得出以下结论：
+根据求解状态 \textbf{""", fields['status'], r"""}，可以得出以下结论：
 
 \begin{itemize}
 \item 问题具有可行解，求解器成功找到最优解
-\item 目标函数最优值为 """ + f"{self.solution['objective_value']:.6f}" + r"""
+\item 目标函数最优值为 """, fields['objective_value'], r"""
 \item 所有约束条件均得到满足
 \item 整数变量取值符合整数约束要求
 \end{itemize}
-"""
-        
-        report += r"""
-\section{总结与结论}
-
-\subsection{求解总结}
-
-本次优化求解任务已成功完成，主要成果如下：
-
-\begin{enumerate}
-\item \textbf{问题建模：}成功构建了包含 """ + str(len(self.solution['variables'])) + r""" 个决策变量和 """ + str(len(getattr(self.model, '_constraints', []))) + r""" 个约束的混合整数线性规划模型
-\item \textbf{算法求解：}采用高性能C++实现的分支定界算法，确保求解的准确性与效率
-\item \textbf{最优解获得：}在 """ + f"{self.solution['solve_time']:.4f}" + r""" 秒内找到最优解，目标函数值为 """ + f"{self.solution['objective_value']:.6f}" + r"""
-\item \textbf{解的验证：}所有约束条件均得到满足，整数约束得到严格执行
-\end{enumerate}
-
-\subsection{技术说明}
-
-\begin{itemize}
-\item \textbf{软件平台：}MIPSolver v1.0 - 基于Python和C++的混合整数规划求解器
-\item \textbf{求解引擎：}自主研发的高性能C++优化核心
-\item \textbf{报告生成：}支持XeLaTeX格式，完美呈现中文内容
-\item \textbf{生成时间：}""" + current_time + r"""
-\end{itemize}
-
-\vspace{1cm}
-
-\begin{center}
-\textit{--- 报告结束 ---}
-
-\small{此报告由 MIPSolver 系统自动生成}
-\end{center}
-
-\end{document}
-"""
-        
-        return report
+"""))
+        return buf.getvalue()
     
-    def create_compile_instructions(self, tex_filename):
-        """创建XeLaTeX编译说明"""
-        from datetime import datetime
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    def create_compile_instructions(self, tex_filename, generated_at=None):
+        """创建XeLaTeX编译说明；generated_at缺省为当前时间"""
+        current_time = (generated_at or datetime.now()).strftime("%Y-%m-%d %H:%M:%S")
         
-        instructions = f"""XeLaTeX 编译说明
-===============================
-
-文件：{tex_filename}
-生成时间：{current_time}
-
-一、系统要求
------------
-1. 安装完整的LaTeX发行版：
-   - macOS: MacTeX (推荐)
-   - Windows: MiKTeX 或 TeX Live
-   - Linux: TeX Live
-
-2. 确保已安装XeLaTeX：
-   打开终端/命令提示符，运行：xelatex --version
-
-3. 中文字体要求：
-   - macOS: 系统自带 PingFang SC 字体
-   - Windows: 需要安装中文字体（如 SimSun）
-   - Linux: 安装 fonts-noto-cjk 包
-
-二、编译方法
------------
-
-方法一：命令行编译（推荐）
-1. 打开终端/命令提示符
-2. 切换到文件所在目录：cd "文件目录路径"
-3. 运行编译命令：
-   xelatex "{tex_filename}"
-4. 如果包含目录，再次运行：
-   xelatex "{tex_filename}"
-
-方法二：LaTeX编辑器
-1. 使用 TeXworks, TeXstudio, VS Code 等编辑器
-2. 打开 .tex 文件
-3. 设置编译器为 XeLaTeX
-4. 点击编译按钮
-
-三、故障排除
------------
-
-问题1：找不到字体
-解决：
-- macOS: 确保系统已安装 PingFang SC
-- Windows: 将第689行改为 \\setCJKmainfont{{SimSun}}
-- Linux: 将第689行改为 \\setCJKmainfont{{Noto Sans CJK SC}}
-
-问题2：编译错误
-解决：
-1. 检查 LaTeX 发行版是否完整安装
-2. 更新宏包：tlmgr update --self --all
-3. 检查文件路径中是否包含特殊字符
-
-问题3：中文显示异常
-解决：
-1. 确保使用 XeLaTeX 而非 pdfLaTeX
-2. 检查中文字体是否正确安装
-3. 确认文件编码为 UTF-8
-
-四、预期输出
------------
-成功编译后将生成：
-- {tex_filename.replace('.tex', '.pdf')} - 最终PDF报告
-- {tex_filename.replace('.tex', '.aux')} - 辅助文件
-- {tex_filename.replace('.tex', '.log')} - 编译日志
-- {tex_filename.replace('.tex', '.toc')} - 目录文件
-
-五、技术支持
------------
-如遇问题，请检查：
-1. LaTeX 发行版版本和完整性
-2. XeLaTeX 编译器可用性
-3. 中文字体安装情况
-4. 文件编码格式（应为UTF-8）
-
-生成工具：MIPSolver v1.0
-技术文档：https://github.com/your-repo/mipsolver
-"""
-        return instructions
+        stem = os.path.splitext(tex_filename)[0]
+        return _COMPILE_INSTRUCTIONS.substitute(
+            tex_filename=tex_filename, current_time=current_time,
+            pdf_name=stem + '.pdf', aux_name=stem + '.aux',
+            log_name=stem + '.log', toc_name=stem + '.toc')
         
     def run(self):
         """运行GUI"""
         self.root.mainloop()
+        self._executor.shutdown(wait=False)
 
 def main():
     """主函数"""
@@ -0,0 +1,17 @@
+# gunicorn.conf.py - MIPSolver API服务器生产部署配置
+#
+# 用法（在gui目录下执行）：
+#   gunicorn -c gunicorn.conf.py api_server:app
+#
+# 说明：
+# - gthread工作模式：每个worker内使用线程池处理请求，适合阻塞型求解调用
+# - preload_app：在fork前导入api_server及mipsolver扩展，worker通过写时复制共享内存
+# - active_models保存在进程内存中，多个worker之间不共享；
+#   多worker部署时需要负载均衡器按model_id做会话保持，否则默认单worker
+import os
+
+bind = os.environ.get("MIPSOLVER_API_BIND", "0.0.0.0:8080")
+worker_class = "gthread"
+workers = int(os.environ.get("MIPSOLVER_API_WORKERS", "1"))
+threads = int(os.environ.get("MIPSOLVER_API_THREADS", "5"))
+preload_app = True
@@ -2,24 +2,247 @@
 """
 MIPSolver 交互式求解器
 """
+import re
 import sys
+import shlex
 import os
 import json
+import time
 import argparse
+import contextlib
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
 
-try:
-    import mipsolver as mp
-    print("MIPSolver导入成功")
-except ImportError as e:
-    print(f"MIPSolver导入失败: {e}")
-    sys.exit(1)
+from mps_reader import build_model, load_mps, ROW_SENSES
+
+# mipsolver在首次建模时才导入，--help 或仅作库导入时不加载C++扩展
+_mp_mod = None
+VERBOSE = False
+
+
+def _mp():
+    """延迟导入并缓存mipsolver模块"""
+    global _mp_mod
+    if _mp_mod is None:
+        try:
+            import mipsolver as _mp_mod
+        except ImportError as e:
+            print(f"MIPSolver导入失败: {e}")
+            sys.exit(1)
+        if VERBOSE:
+            print("MIPSolver导入成功")
+    return _mp_mod
+
+# 表达式记号类型
+NUM, IDENT, OP = 'num', 'ident', 'op'
+
+# 运算符优先级；neg为一元负号（右结合）
+_PRECEDENCE = {'+': 1, '-': 1, '*': 2, 'neg': 3}
+
+# set_objective末尾可选的优化方向关键字
+_SENSES = frozenset(('maximize', 'minimize'))
+# set_objective方法本身还接受max作为maximize的简写
+_MAXIMIZE_SENSES = frozenset(('maximize', 'max'))
+
+
+# 数字（可带指数，如 1e3、2.5E-4）
+_NUMBER = r'(?:\d+(?:\.\d*)?|\.\d+)(?:[eE][-+]?\d+)?'
+
+# 记号正则：数字、标识符或运算符/括号，前面可有空白
+_TOKEN_RE = re.compile(rf'\s*(?:({_NUMBER})|([^\W\d]\w*)|([-+*()]))')
+
+
+# 快速路径：最常见的一到两项表达式，如 3*x、x + y、2*x - 1.5*y
+_SIMPLE_TERM = rf'(?:({_NUMBER})\s*\*\s*)?([^\W\d]\w*)'
+_SIMPLE_EXPR_RE = re.compile(
+    rf'\s*([-+]?)\s*{_SIMPLE_TERM}(?:\s*([-+])\s*{_SIMPLE_TERM})?\s*')
+
+
+def compile_simple(expr_str):
+    """匹配一到两项的简单表达式，返回 ((系数, 变量名), ...)；不匹配时返回None"""
+    m = _SIMPLE_EXPR_RE.fullmatch(expr_str)
+    if m is None:
+        return None
+    sign1, coeff1, name1, sign2, coeff2, name2 = m.groups()
+    terms = ((_signed(sign1, coeff1), sys.intern(name1)),)
+    if name2 is not None:
+        terms += ((_signed(sign2, coeff2), sys.intern(name2)),)
+    return terms
+
+
+def _signed(sign, coeff):
+    """由符号和可省略的系数文本得到带符号的系数"""
+    value = float(coeff) if coeff else 1.0
+    return -value if sign == '-' else value
+
+
+def evaluate_simple(terms, variables):
+    """按compile_simple的结果直接构造线性表达式，变量不存在时抛出KeyError"""
+    expr = _mp().LinExpr()
+    for coeff, name in terms:
+        expr.add_term(coeff, variables[name])
+    return expr
+
+
+def _unquote(token):
+    """去掉参数两端成对的引号"""
+    if len(token) >= 2 and token[0] == token[-1] and token[0] in '"\'':
+        return token[1:-1]
+    return token
+
+
+def split_command(command):
+    """
+    把一行命令切分为参数，支持带引号的参数，如 load "my file.mps"
+
+    使用非POSIX模式，Windows路径中的反斜杠原样保留；引号不成对
+    （如参数中含撇号）时退回按空白切分
+    """
+    try:
+        return [_unquote(token) for token in shlex.split(command, posix=False)]
+    except ValueError:
+        return command.split()
+
+
+def _tokenize(expr_str):
+    """用预编译的正则单遍扫描表达式字符串，返回 [(记号类型, 值), ...]"""
+    tokens = []
+    append = tokens.append
+    match = _TOKEN_RE.match
+    pos, end = 0, len(expr_str.rstrip())
+    while pos < end:
+        m = match(expr_str, pos)
+        if m is None:
+            raise ValueError(f"无法识别的字符: {expr_str[pos:].lstrip()[:1]}")
+        number, name, op = m.groups()
+        if number is not None:
+            append((NUM, float(number)))
+        elif name is not None:
+            append((IDENT, sys.intern(name)))
+        else:
+            append((OP, op))
+        pos = m.end()
+    return tokens
+
+
+def _is_operand_end(token):
+    """记号之后能否直接跟运算符（数字、变量或右括号）"""
+    return token is not None and (token[0] != OP or token[1] == ')')
+
+
+def compile_expression(expr_str):
+    """
+    用调度场算法把线性表达式编译为后缀记号列表
+    
+    只支持数字、变量名、+、-、*、一元正负号和括号
+    """
+    output, stack = [], []
+    prev = None
+    for token in _tokenize(expr_str):
+        kind, value = token
+        if kind != OP or value == '(':
+            if _is_operand_end(prev):
+                raise ValueError("缺少运算符")
+            if kind == OP:
+                stack.append(value)
+            else:
+                output.append(token)
+        elif value == ')':
+            while stack and stack[-1] != '(':
+                output.append((OP, stack.pop()))
+            if not stack or not _is_operand_end(prev):
+                raise ValueError("括号不匹配")
+            stack.pop()
+        else:
+            op = value
+            if not _is_operand_end(prev):
+                # 一元运算符
+                if op == '*':
+                    raise ValueError("缺少运算数")
+                if op == '+':
+                    prev = token
+                    continue
+                op = 'neg'
+            while stack and stack[-1] != '(' and (
+                    _PRECEDENCE[stack[-1]] > _PRECEDENCE[op]
+                    or (_PRECEDENCE[stack[-1]] == _PRECEDENCE[op] and op != 'neg')):
+                output.append((OP, stack.pop()))
+            stack.append(op)
+        prev = token
+    
+    if not _is_operand_end(prev):
+        raise ValueError("表达式不完整")
+    while stack:
+        op = stack.pop()
+        if op == '(':
+            raise ValueError("括号不匹配")
+        output.append((OP, op))
+    return output
+
+
+def _add(left, right, sign):
+    """计算 left + sign*right；left为求值过程中新建的LinExpr时原地累加，避免复制"""
+    linexpr = _mp().LinExpr
+    if isinstance(left, linexpr):
+        if isinstance(right, linexpr):
+            for var, coeff in right.get_terms():
+                left.add_term(sign * coeff, var)
+            left.add_constant(sign * right.get_constant())
+        elif isinstance(right, (int, float)):
+            left.add_constant(sign * right)
+        else:
+            left.add_term(sign, right)
+        return left
+    # 变量和表达式没有减法/取负运算，用乘以-1代替
+    return left + (right if sign > 0 else -1 * right)
+
+
+def evaluate_postfix(postfix, variables):
+    """
+    按当前变量对后缀记号列表求值
+    
+    变量通过variables字典按名称查找，未定义的变量抛出KeyError
+    """
+    stack = []
+    push = stack.append
+    for kind, value in postfix:
+        if kind == NUM:
+            push(value)
+        elif kind == IDENT:
+            push(variables[value])
+        elif value == 'neg':
+            stack[-1] = -1 * stack[-1]
+        else:
+            right = stack.pop()
+            left = stack.pop()
+            if value == '*':
+                push(left * right)
+            else:
+                push(_add(left, right, 1 if value == '+' else -1))
+    return stack[0]
+
 
 class InteractiveSolver:
     def __init__(self):
         self.model = None
         self.variables = {}
-        self.constraints = {}
+        self._var_names = []  # 按添加顺序排列，与model.get_values()一一对应
+        self._n_constraints = 0  # 已添加的约束数
+        self._expr_cache = {}  # 表达式字符串 -> 简单项元组或后缀记号列表
+        # 命令名 -> 处理方法；处理方法返回True时退出交互循环
+        self._cmds = {
+            'quit': self._cmd_quit,
+            'exit': self._cmd_quit,
+            'help': self._cmd_help,
+            'new': self._cmd_new,
+            'add_var': self._cmd_add_var,
+            'set_objective': self._cmd_set_objective,
+            'add_constraint': self._cmd_add_constraint,
+            'solve': self._cmd_solve,
+            'load': self._cmd_load,
+            'status': self._cmd_status,
+            'example': self._cmd_example,
+        }
         
     def display_banner(self):
         print("=" * 60)
@@ -50,9 +273,10 @@ class InteractiveSolver:
         """)
         
     def create_model(self, name="model"):
-        self.model = mp.Model(name)
+        self.model = _mp().Model(name)
         self.variables = {}
-        self.constraints = {}
+        self._var_names = []
+        self._n_constraints = 0
         print(f"创建模型: {name}")
         
     def add_variable(self, name, vtype="continuous"):
@@ -60,6 +284,7 @@ class InteractiveSolver:
             print("请先创建模型")
             return
             
+        mp = _mp()
         type_map = {
             'continuous': mp.CONTINUOUS,
             'integer': mp.INTEGER, 
@@ -70,63 +295,49 @@ class InteractiveSolver:
             print(f"未知变量类型: {vtype}")
             return
             
+        name = sys.intern(name)  # 变量名长期作为字典键，驻留后比较退化为指针比较
         var = self.model.add_var(name=name, vtype=type_map[vtype.lower()], lb=0)
         self.variables[name] = var
+        self._var_names.append(name)
         print(f"添加变量: {name} ({vtype})")
         
     def parse_expression(self, expr_str):
-        """简单的表达式解析"""
-        expr_str = expr_str.replace(' ', '')
-        expr = None
-        
-        # 分割项
-        terms = expr_str.replace('-', '+-').split('+')
+        """
+        解析线性表达式
         
-        for term in terms:
-            if not term:
-                continue
-                
-            if term.replace('-', '').isdigit():
-                # 常数项
-                const = float(term)
-                if expr is None:
-                    expr = const
-                else:
-                    expr += const
-            elif '*' in term:
-                # 系数*变量
-                parts = term.split('*')
-                coeff = float(parts[0])
-                var_name = parts[1]
-                if var_name in self.variables:
-                    if expr is None:
-                        expr = coeff * self.variables[var_name]
-                    else:
-                        expr += coeff * self.variables[var_name]
-                else:
-                    print(f"未定义变量: {var_name}")
-                    return None
-            else:
-                # 单个变量
-                var_name = term.replace('-', '') if term.startswith('-') else term
-                coeff = -1 if term.startswith('-') else 1
-                if var_name in self.variables:
-                    if expr is None:
-                        expr = coeff * self.variables[var_name]
-                    else:
-                        expr += coeff * self.variables[var_name]
-                else:
-                    print(f"未定义变量: {var_name}")
+        同一表达式字符串只编译一次，缓存的编译结果每次按当前变量重新求值；
+        一到两项的简单表达式走快速路径，不经过通用的后缀表达式求值
+        """
+        compiled = self._expr_cache.get(expr_str)
+        if compiled is None:
+            compiled = compile_simple(expr_str)
+            if compiled is None:
+                try:
+                    compiled = compile_expression(expr_str)
+                except ValueError as e:
+                    print(f"无效表达式: {expr_str} ({e})")
                     return None
-                    
-        return expr
+            self._expr_cache[expr_str] = compiled
+        
+        try:
+            if type(compiled) is tuple:
+                return evaluate_simple(compiled, self.variables)
+            return evaluate_postfix(compiled, self.variables)
+        except KeyError as e:
+            print(f"未定义变量: {e.args[0]}")
+            return None
+        except TypeError as e:
+            # 如变量相乘等非线性运算
+            print(f"无效表达式: {expr_str} ({e})")
+            return None
         
     def set_objective(self, expr_str, sense="minimize"):
         if not self.model:
             print("请先创建模型")
             return
             
-        obj_sense = mp.MAXIMIZE if sense.lower() in ['max', 'maximize'] else mp.MINIMIZE
+        mp = _mp()
+        obj_sense = mp.MAXIMIZE if sense.lower() in _MAXIMIZE_SENSES else mp.MINIMIZE
         expr = self.parse_expression(expr_str)
         
         if expr is not None:
@@ -153,6 +364,7 @@ class InteractiveSolver:
                         constraint = lhs == rhs
                         
                     self.model.add_constr(constraint)
+                    self._n_constraints += 1
                     print(f"添加约束: {constraint_str}")
                 return
                 
@@ -171,12 +383,14 @@ class InteractiveSolver:
             print("求解结果:")
             print("="*50)
             
-            if hasattr(self.model, 'status') and self.model.status == mp.OPTIMAL:
+            if hasattr(self.model, 'status') and self.model.status == _mp().OPTIMAL:
                 print("状态: 最优解")
                 print(f"目标值: {self.model.obj_val:.6f}")
                 print("\n变量值:")
-                for name, var in self.variables.items():
-                    print(f"  {name} = {var.value:.6f}")
+                # 一次取出全部解值，避免逐个访问var.value
+                values = self.model.get_values()
+                print("\n".join(f"  {name} = {value:.6f}"
+                                for name, value in zip(self._var_names, values)))
             else:
                 print(f"状态: {getattr(self.model, 'status', 'UNKNOWN')}")
                 
@@ -184,13 +398,31 @@ class InteractiveSolver:
             print(f"求解失败: {e}")
             
     def load_mps_file(self, filename):
-        """加载MPS文件"""
+        """加载MPS文件，返回是否成功；文件无法解析时抛出异常"""
         if not os.path.exists(filename):
             print(f"文件不存在: {filename}")
-            return
+            return False
             
         print(f"加载MPS文件: {filename}")
-        print("(MPS解析功能开发中...)")
+        if not self.model:
+            self.create_model(Path(filename).stem)
+        
+        # 解析结果按文件内容缓存在磁盘上，同一文件再次加载时跳过解析
+        parsed = load_mps(filename)
+        if not parsed['col_names']:
+            print(f"文件中没有COLUMNS数据，可能不是MPS文件: {filename}")
+            return False
+        # 变量和约束追加到当前模型，之后仍可继续用命令修改
+        var_objs = build_model(self.model, parsed)
+        for name, var in zip(parsed['col_names'], var_objs):
+            if var is not None:
+                name = sys.intern(name)
+                self.variables[name] = var
+                self._var_names.append(name)
+        n_constraints = sum(row_type in ROW_SENSES for row_type in parsed['row_types'])
+        self._n_constraints += n_constraints
+        print(f"已加载 {len(parsed['col_names'])} 个变量, {n_constraints} 个约束")
+        return True
         
     def show_status(self):
         if not self.model:
@@ -200,7 +432,7 @@ class InteractiveSolver:
         print(f"\n模型状态:")
         print(f"  名称: {self.model.name}")
         print(f"  变量数: {len(self.variables)}")
-        print(f"  约束数: {len(self.constraints)}")
+        print(f"  约束数: {self._n_constraints}")
         
     def run_example(self):
         print("运行示例问题...")
@@ -213,6 +445,53 @@ class InteractiveSolver:
         self.add_constraint("x + y <= 10")
         self.solve_model()
         
+    def _cmd_quit(self, args):
+        print("再见!")
+        return True
+
+    def _cmd_help(self, args):
+        self.show_help()
+
+    def _cmd_new(self, args):
+        self.create_model(args[0] if args else "model")
+
+    def _cmd_add_var(self, args):
+        if len(args) < 2:
+            print("用法: add_var <name> <type>")
+            return
+        self.add_variable(args[0], args[1])
+
+    def _cmd_set_objective(self, args):
+        if not args:
+            print("用法: set_objective <expression> [sense]")
+            return
+        last = args[-1].lower() if len(args) > 1 else ''
+        if last in _SENSES:
+            self.set_objective(' '.join(args[:-1]), last)
+        else:
+            self.set_objective(' '.join(args), 'minimize')
+
+    def _cmd_add_constraint(self, args):
+        if not args:
+            print("用法: add_constraint <expression>")
+            return
+        self.add_constraint(' '.join(args))
+
+    def _cmd_solve(self, args):
+        self.solve_model()
+
+    def _cmd_load(self, args):
+        if not args:
+            print("用法: load <filename>")
+            return
+        self.load_mps_file(args[0])
+
+    def _cmd_status(self, args):
+        self.show_status()
+
+    def _cmd_example(self, args):
+        self.run_example()
+
     def interactive_mode(self):
         self.display_banner()
         self.show_help()
@@ -223,67 +502,73 @@ class InteractiveSolver:
                 if not command:
                     continue
                     
-                parts = command.split()
-                cmd = parts[0].lower()
-                
-                if cmd in ['quit', 'exit']:
-                    print("再见!")
-                    break
-                elif cmd == 'help':
-                    self.show_help()
-                elif cmd == 'new':
-                    name = parts[1] if len(parts) > 1 else "model"
-                    self.create_model(name)
-                elif cmd == 'add_var':
-                    if len(parts) < 3:
-                        print("用法: add_var <name> <type>")
-                        continue
-                    self.add_variable(parts[1], parts[2])
-                elif cmd == 'set_objective':
-                    if len(parts) < 2:
-                        print("用法: set_objective <expression> [sense]")
-                        continue
-                    expr = ' '.join(parts[1:-1]) if len(parts) > 2 and parts[-1].lower() in ['maximize', 'minimize'] else ' '.join(parts[1:])
-                    sense = parts[-1] if len(parts) > 2 and parts[-1].lower() in ['maximize', 'minimize'] else 'minimize'
-                    self.set_objective(expr, sense)
-                elif cmd == 'add_constraint':
-                    if len(parts) < 2:
-                        print("用法: add_constraint <expression>")
-                        continue
-                    constraint = ' '.join(parts[1:])
-                    self.add_constraint(constraint)
-                elif cmd == 'solve':
-                    self.solve_model()
-                elif cmd == 'load':
-                    if len(parts) < 2:
-                        print("用法: load <filename>")
-                        continue
-                    self.load_mps_file(parts[1])
-                elif cmd == 'status':
-                    self.show_status()
-                elif cmd == 'example':
-                    self.run_example()
-                else:
+                cmd, *args = split_command(command)
+                handler = self._cmds.get(cmd.lower())
+                if handler is None:
                     print(f"未知命令: {cmd}")
+                elif handler(args):
+                    break
                     
             except KeyboardInterrupt:
                 print("\n使用 'quit' 退出")
+            except EOFError:
+                # 从管道读取批处理命令时输入结束
+                break
             except Exception as e:
                 print(f"错误: {e}")
 
+def _solve_one(path):
+    """
+    在独立进程中加载并求解一个文件，返回 (文件, 目标值, 求解耗时)
+
+    文件不存在或无法解析时抛出异常，由主进程报告为失败而不是"无最优解"
+    """
+    if not os.path.exists(path):
+        raise FileNotFoundError("文件不存在")
+    solver = InteractiveSolver()
+    # 各进程的建模、求解输出会互相穿插，只由主进程汇总打印结果
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        solver.create_model(Path(path).stem)
+        if not solver.load_mps_file(path):
+            raise ValueError("文件中没有COLUMNS数据，可能不是MPS文件")
+        start_ns = time.perf_counter_ns()
+        solver.solve_model()
+        elapsed = (time.perf_counter_ns() - start_ns) * 1e-9
+    model = solver.model
+    obj_val = model.obj_val if getattr(model, 'status', None) == _mp().OPTIMAL else None
+    return path, obj_val, elapsed
+
+
 def main():
     parser = argparse.ArgumentParser(description='MIPSolver 交互式求解器')
-    parser.add_argument('--file', '-f', help='直接加载文件')
+    parser.add_argument('--file', '-f', nargs='+', help='直接加载文件，可指定多个文件并行求解')
+    parser.add_argument('--jobs', '-j', type=int, default=None, help='并行求解的进程数（默认CPU核数）')
+    parser.add_argument('--verbose', '-v', action='store_true', help='显示详细信息')
     
     args = parser.parse_args()
-    solver = InteractiveSolver()
+    global VERBOSE
+    VERBOSE = args.verbose
     
-    if args.file:
+    if args.file and len(args.file) > 1:
+        # 各文件相互独立，分发到多个进程求解
+        with ProcessPoolExecutor(max_workers=args.jobs) as executor:
+            futures = {executor.submit(_solve_one, path): path for path in args.file}
+            for future in as_completed(futures):
+                path = futures[future]
+                try:
+                    _, obj_val, elapsed = future.result()
+                except Exception as e:
+                    print(f"{path}: 失败 - {e}")
+                    continue
+                obj_text = f"{obj_val:.6f}" if obj_val is not None else "无最优解"
+                print(f"{path}: 目标值 {obj_text}, 耗时 {elapsed:.3f}s")
+    elif args.file:
+        solver = InteractiveSolver()
         solver.create_model("file_model")
-        solver.load_mps_file(args.file)
+        solver.load_mps_file(args.file[0])
         solver.solve_model()
     else:
-        solver.interactive_mode()
+        InteractiveSolver().interactive_mode()
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -0,0 +1,277 @@
+#!/usr/bin/env python3
+"""
+MIPSolver MPS文件读取
+
+桌面GUI、Web界面和交互式求解器共用的MPS解析器：read_mps_file只做文本解析，
+不依赖mipsolver；build_model再把解析结果加入mipsolver模型。
+load_mps_bytes/load_mps在解析前先查按文件内容哈希存放的磁盘缓存
+"""
+import io
+import os
+import pickle
+import hashlib
+import tempfile
+from array import array
+from pathlib import Path
+
+# MPS段名到段编号的映射；NAME、RANGES、BOUNDS段的内容被忽略
+_MPS_ROWS, _MPS_COLUMNS, _MPS_RHS = 1, 2, 3
+_MPS_SECTION_IDS = {
+    'NAME': 0,
+    'ROWS': _MPS_ROWS,
+    'COLUMNS': _MPS_COLUMNS,
+    'RHS': _MPS_RHS,
+    'RANGES': 4,
+    'BOUNDS': 5
+}
+
+# 解析结果的磁盘缓存：按文件内容哈希存放，内容不变的文件再次加载时跳过解析
+MPS_CACHE_DIR = Path(os.environ.get("MIPSOLVER_CACHE_DIR", Path.home() / ".cache" / "mipsolver"))
+MPS_CACHE_MAX_BYTES = 1 << 30
+_MPS_CACHE_VERSION = 4  # read_mps_file的解析规则或输出格式变化时递增，使旧缓存失效
+
+# MPS行类型到约束构造方式的映射
+ROW_SENSES = {
+    'L': lambda lhs, rhs: lhs <= rhs,
+    'G': lambda lhs, rhs: lhs >= rhs,
+    'E': lambda lhs, rhs: lhs == rhs
+}
+
+def read_mps_file(f):
+    """
+    从文本文件对象f读取MPS内容，返回与求解器无关的解析结果（可直接pickle缓存）
+
+    单遍流式读取；行、列按出现顺序编号，系数以 (行号, 列号, 系数) 三个并列的
+    紧凑数组收集，读完后按行整理为CSR格式（row_ptr, csr_cols, csr_vals）
+    """
+    current_section = None
+    objective = None
+    row_index = {}          # 行名 -> 约束行号，目标函数行为-1
+    row_names = []          # 约束行号 -> 行名
+    row_types = []          # 约束行号 -> 约束类型(L/G/E)
+    rhs_values = array('d')  # 约束行号 -> 右端常数
+    col_index = {}          # 变量名 -> 列号
+    col_names = []          # 列号 -> 变量名
+    col_integer = bytearray()  # 列号 -> 是否为整数变量
+    # COLUMNS段的系数：行号、列号并列存放，系数先以字符串收集，读完后整体一次转换
+    entry_rows, entry_cols, entry_coeffs = array('i'), array('i'), []
+    in_int_section = False
+    
+    # 简单的MPS解析器：逐行流式处理的状态机，段头从第1列开始，数据行以空白开头
+    for line in f:
+        first = line[:1]
+        if first == '*':
+            continue
+        if first and not first.isspace():
+            header = line.split(None, 1)[0]
+            if header == 'ENDATA':
+                break
+            # 未知段（如OBJSENSE）的内容被忽略
+            current_section = _MPS_SECTION_IDS.get(header)
+            continue
+        
+        parts = line.split()
+        if not parts or parts[0][0] == '*':
+            continue
+        
+        # 按出现频率排列：COLUMNS段占绝大多数行
+        if current_section == _MPS_COLUMNS:
+            # 解析列（变量），每行可以有一组或两组 (行名, 系数)
+            if len(parts) < 3:
+                continue
+            # 整数变量标记行: <名称> 'MARKER' 'INTORG' / 'INTEND'
+            if parts[1] == "'MARKER'":
+                in_int_section = parts[2] == "'INTORG'"
+                continue
+            var_name = parts[0]
+            col = col_index.get(var_name)
+            if col is None:
+                col = col_index[var_name] = len(col_names)
+                col_names.append(var_name)
+                col_integer.append(in_int_section)
+            
+            for k in (1, 3) if len(parts) >= 5 else (1,):
+                row = row_index.get(parts[k])
+                if row is not None:
+                    entry_rows.append(row)
+                    entry_cols.append(col)
+                    entry_coeffs.append(parts[k + 1])
+        elif current_section == _MPS_ROWS:
+            # 解析行（约束和目标）
+            if len(parts) >= 2:
+                row_type = parts[0]
+                row_name = parts[1]
+                
+                if row_type == 'N':
+                    # 目标函数行，以最后一个N行为准
+                    if objective is not None:
+                        del row_index[objective]
+                    objective = row_name
+                    row_index[row_name] = -1
+                elif row_name in row_index:
+                    # 重复声明的约束行只更新类型
+                    row_types[row_index[row_name]] = row_type
+                else:
+                    # 约束行
+                    row_index[row_name] = len(row_names)
+                    row_names.append(row_name)
+                    row_types.append(row_type)
+                    rhs_values.append(0.0)
+        elif current_section == _MPS_RHS:
+            # 解析右端常数
+            if len(parts) < 3:
+                continue
+            for k in (1, 3) if len(parts) >= 5 else (1,):
+                row = row_index.get(parts[k])
+                if row is not None and row >= 0:
+                    rhs_values[row] = float(parts[k + 1])
+    
+    # map(float)在C层循环中完成整段转换
+    entry_vals = array('d', map(float, entry_coeffs))
+    
+    # 计数排序整理为CSR：同一行内保持系数在文件中的出现顺序
+    n_rows = len(row_names)
+    row_ptr = array('i', bytes(4 * (n_rows + 1)))
+    for row in entry_rows:
+        if row >= 0:
+            row_ptr[row + 1] += 1
+    for i in range(n_rows):
+        row_ptr[i + 1] += row_ptr[i]
+    nnz = row_ptr[n_rows]
+    csr_cols = array('i', bytes(4 * nnz))
+    csr_vals = array('d', bytes(8 * nnz))
+    obj_cols, obj_vals = array('i'), array('d')
+    fill = row_ptr[:-1]
+    for row, col, val in zip(entry_rows, entry_cols, entry_vals):
+        if row < 0:
+            # 目标函数系数
+            obj_cols.append(col)
+            obj_vals.append(val)
+        else:
+            # 约束系数
+            pos = fill[row]
+            csr_cols[pos] = col
+            csr_vals[pos] = val
+            fill[row] = pos + 1
+    
+    return {
+        'objective': objective,
+        'col_names': col_names,
+        'col_integer': col_integer,
+        'obj_cols': obj_cols,
+        'obj_vals': obj_vals,
+        'row_names': row_names,
+        'row_types': row_types,
+        'rhs_values': rhs_values,
+        'row_ptr': row_ptr,
+        'csr_cols': csr_cols,
+        'csr_vals': csr_vals
+    }
+
+def build_model(model, parsed):
+    """
+    把read_mps_file的解析结果加入模型，约束只遍历各行自身的非零系数（O(nnz)）
+
+    返回按列号排列的变量对象列表，添加失败的变量为None
+    """
+    # 只有建模时才需要mipsolver，仅解析文件时不加载C++扩展
+    import mipsolver as mp
+    objective_sense = mp.MINIMIZE
+    
+    var_objs = []  # 列号 -> 变量对象，添加失败的变量为None
+    for var_name, is_integer in zip(parsed['col_names'], parsed['col_integer']):
+        try:
+            var_objs.append(model.add_var(name=var_name, vtype=mp.INTEGER if is_integer else mp.CONTINUOUS))
+        except Exception as e:
+            print(f"添加变量失败: {e}")
+            var_objs.append(None)
+    
+    # 设置目标函数
+    if parsed['objective']:
+        try:
+            obj_expr = mp.LinExpr()
+            for col, coeff in zip(parsed['obj_cols'], parsed['obj_vals']):
+                if var_objs[col] is not None:
+                    obj_expr.add_term(coeff, var_objs[col])
+            model.set_objective(obj_expr, objective_sense)
+        except Exception as e:
+            print(f"设置目标函数失败: {e}")
+    
+    # 添加约束：按CSR逐行取出该行的非零系数
+    row_ptr = parsed['row_ptr']
+    csr_cols = parsed['csr_cols']
+    csr_vals = parsed['csr_vals']
+    rows = zip(parsed['row_names'], parsed['row_types'], parsed['rhs_values'])
+    for i, (constr_name, row_type, rhs) in enumerate(rows):
+        try:
+            lhs = mp.LinExpr()
+            start, end = row_ptr[i], row_ptr[i + 1]
+            for col, coeff in zip(csr_cols[start:end], csr_vals[start:end]):
+                if var_objs[col] is not None:
+                    lhs.add_term(coeff, var_objs[col])
+            
+            make_constraint = ROW_SENSES.get(row_type)
+            if make_constraint is not None:
+                model.add_constr(make_constraint(lhs, rhs), name=constr_name)
+        except Exception as e:
+            print(f"添加约束失败: {e}")
+    
+    return var_objs
+
+
+def content_digest(data):
+    """文件内容(bytes)的哈希，用作缓存键"""
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def load_mps_bytes(data, digest=None):
+    """
+    按文件内容(bytes)获取read_mps_file的解析结果
+
+    磁盘缓存命中时直接反序列化，未命中时解析并写入缓存；
+    digest为调用方已算好的content_digest(data)，缺省时在此计算
+    """
+    cache_path = MPS_CACHE_DIR / f"{digest or content_digest(data)}-v{_MPS_CACHE_VERSION}.pkl"
+    parsed = _load_cached(cache_path)
+    if parsed is None:
+        parsed = read_mps_file(io.TextIOWrapper(io.BytesIO(data), encoding='utf-8'))
+        _store_cached(cache_path, parsed)
+    return parsed
+
+
+def load_mps(filename):
+    """读取并解析MPS文件，经由load_mps_bytes使用磁盘缓存"""
+    with open(filename, 'rb') as f:
+        return load_mps_bytes(f.read())
+
+
+def _load_cached(path):
+    """读取缓存的解析结果，不存在或已损坏时返回None"""
+    try:
+        with open(path, 'rb') as f:
+            parsed = pickle.load(f)
+        os.utime(path)  # 更新修改时间，淘汰时按最近使用排序
+        return parsed
+    except (OSError, EOFError, pickle.UnpicklingError):
+        return None
+
+
+def _store_cached(path, parsed):
+    """写入缓存并在超出容量时淘汰最久未使用的条目；缓存失败不影响解析"""
+    try:
+        MPS_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        # 先写临时文件再原子替换，避免并发进程读到写了一半的缓存
+        fd, tmp = tempfile.mkstemp(dir=MPS_CACHE_DIR, suffix='.tmp')
+        with os.fdopen(fd, 'wb') as f:
+            pickle.dump(parsed, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, path)
+        entries = sorted((entry.stat().st_mtime, entry.stat().st_size, entry)
+                         for entry in MPS_CACHE_DIR.glob('*.pkl'))
+        total = sum(size for _, size, _ in entries)
+        for _, size, entry in entries:
+            if total <= MPS_CACHE_MAX_BYTES:
+                break
+            entry.unlink()
+            total -= size
+    except OSError as e:
+        print(f"写入MPS缓存失败: {e}")
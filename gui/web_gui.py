@@ -5,32 +5,81 @@ MIPSolver Web界面
 """
 import os
 import json
+import gzip
+import hashlib
+import secrets
+import itertools
 import tempfile
+import threading
 import base64
 import time
+from collections import OrderedDict
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, Any, Optional
 
 try:
-    from flask import Flask, request, jsonify, render_template_string, send_file
+    from flask import Flask, Response, request, jsonify, render_template_string, send_file
+    from flask.json.provider import DefaultJSONProvider
     from flask_cors import CORS
     from werkzeug.utils import secure_filename
 except ImportError:
     print("请安装Flask: pip install flask flask-cors werkzeug")
     exit(1)
 
+from mps_reader import build_model, content_digest, load_mps_bytes
+
+try:
+    # flask_compress为可选依赖，用于压缩API的JSON响应
+    from flask_compress import Compress
+except ImportError:
+    Compress = None
+
+try:
+    # asgiref为可选依赖，用于在Uvicorn等ASGI服务器下运行
+    from asgiref.wsgi import WsgiToAsgi
+except ImportError:
+    WsgiToAsgi = None
+
+try:
+    # orjson为可选依赖，未安装时回退到Flask默认的标准库json
+    import orjson
+except ImportError:
+    orjson = None
+
 try:
     import mipsolver as mp
-    from mipsolver import Model, CONTINUOUS, INTEGER, BINARY, MAXIMIZE, MINIMIZE
+    from mipsolver import Model, CONTINUOUS, BINARY, MAXIMIZE
     print("MIPSolver导入成功")
 except ImportError as e:
     print(f"MIPSolver导入失败: {e}")
     # 使用模拟数据
     mp = None
 
+
+class OrjsonProvider(DefaultJSONProvider):
+    """使用orjson序列化jsonify响应的JSON提供器"""
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY).decode('utf-8')
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
 app = Flask(__name__)
+if orjson is not None:
+    app.json = OrjsonProvider(app)
 CORS(app)
+if Compress is not None:
+    # 页面和脚本已预先压缩，这里只压缩动态的JSON响应（如大规模求解结果）
+    app.config['COMPRESS_MIMETYPES'] = ['application/json']
+    app.config['COMPRESS_LEVEL'] = 6
+    Compress(app)
+
+# ASGI入口: uvicorn web_gui:asgi_app --host 0.0.0.0 --port 5001
+# 每个请求在服务器线程池中执行，解析和求解不会阻塞事件循环及其他请求
+asgi_app = WsgiToAsgi(app) if WsgiToAsgi is not None else None
 
 # 配置
 UPLOAD_FOLDER = 'uploads'
@@ -38,11 +87,21 @@ ALLOWED_EXTENSIONS = {'mps', 'txt'}
 app.config['UPLOAD_FOLDER'] = UPLOAD_FOLDER
 app.config['MAX_CONTENT_LENGTH'] = 16 * 1024 * 1024  # 16MB
 
+# 解析结果的进程内缓存：按文件内容哈希存放，相同文件重复上传时跳过解析；
+# 未命中时再查mps_reader的磁盘缓存
+MPS_MEMO_SIZE = 32     # 进程内缓存最多保留的解析结果数
+_parsed_memo = OrderedDict()
+_parsed_lock = threading.Lock()
+
 # 确保上传目录存在
 os.makedirs(UPLOAD_FOLDER, exist_ok=True)
 
 # 全局存储
-active_problems = {}
+_problem_ids = itertools.count()
+# 按最近使用排序，超出MAX_PROBLEMS时淘汰最久未使用的问题
+MAX_PROBLEMS = int(os.environ.get("MIPSOLVER_WEB_MAX_PROBLEMS", "64"))
+active_problems = OrderedDict()
+_problems_lock = threading.Lock()
 solver_options = {
     "branch_bound": "分支定界法",
     "simplex": "单纯形法", 
@@ -50,117 +109,80 @@ solver_options = {
     "cplex": "CPLEX"
 }
 
+def get_problem(problem_id):
+    """取出问题数据并标记为最近使用，不存在时返回None"""
+    with _problems_lock:
+        problem_data = active_problems.get(problem_id)
+        if problem_data is not None:
+            active_problems.move_to_end(problem_id)
+        return problem_data
+
+def add_problem(problem_data):
+    """加入问题数据，超出容量时淘汰最久未使用的问题"""
+    with _problems_lock:
+        active_problems[problem_data['id']] = problem_data
+        evicted = []
+        while len(active_problems) > MAX_PROBLEMS:
+            evicted.append(active_problems.popitem(last=False)[1])
+    for old in evicted:
+        _remove_upload(old)
+
+def remove_problem(problem_id):
+    """删除问题数据，返回是否存在"""
+    with _problems_lock:
+        problem_data = active_problems.pop(problem_id, None)
+    if problem_data is None:
+        return False
+    _remove_upload(problem_data)
+    return True
+
+def _remove_upload(problem_data):
+    """删除问题对应的上传文件；同名文件仍被其他问题使用时保留"""
+    filepath = problem_data['filepath']
+    with _problems_lock:
+        in_use = any(data['filepath'] == filepath for data in active_problems.values())
+    if not in_use:
+        try:
+            os.unlink(filepath)
+        except OSError:
+            pass
+
 def allowed_file(filename):
     return '.' in filename and filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
 
-def parse_mps_file(filename):
-    """解析MPS文件"""
+def load_parsed_mps(data):
+    """
+    按文件内容(bytes)的哈希获取解析结果
+
+    依次查找进程内LRU缓存和mps_reader的磁盘缓存，都未命中时才解析；
+    相同内容的文件重复上传时跳过解析
+    """
+    digest = content_digest(data)
+    with _parsed_lock:
+        parsed = _parsed_memo.get(digest)
+        if parsed is not None:
+            _parsed_memo.move_to_end(digest)
+            return parsed
+    
+    parsed = load_mps_bytes(data, digest)
+    
+    with _parsed_lock:
+        _parsed_memo[digest] = parsed
+        while len(_parsed_memo) > MPS_MEMO_SIZE:
+            _parsed_memo.popitem(last=False)
+    return parsed
+
+def parse_mps_file(data, name):
+    """解析内存中的MPS文件内容，name为模型名后缀"""
     try:
-        model = Model(f"model_{Path(filename).stem}")
+        model = Model(f"model_{name}")
     except Exception as e:
         # 如果Model创建失败，创建一个简单的测试模型
         print(f"Model创建失败: {e}")
         model = create_test_model()
         return model
     
-    # 简单的MPS解析器
-    with open(filename, 'r') as f:
-        lines = f.readlines()
-    
-    current_section = None
-    variables = {}
-    constraints = {}
-    objective = None
-    objective_sense = MINIMIZE
-    
-    for line in lines:
-        line = line.strip()
-        if not line or line.startswith('*'):
-            continue
-            
-        if line == 'NAME':
-            current_section = 'NAME'
-        elif line == 'ROWS':
-            current_section = 'ROWS'
-        elif line == 'COLUMNS':
-            current_section = 'COLUMNS'
-        elif line == 'RHS':
-            current_section = 'RHS'
-        elif line == 'BOUNDS':
-            current_section = 'BOUNDS'
-        elif line == 'ENDATA':
-            break
-        elif current_section == 'ROWS':
-            # 解析行（约束和目标）
-            parts = line.split()
-            if len(parts) >= 2:
-                row_type = parts[0]
-                row_name = parts[1]
-                
-                if row_type == 'N':
-                    # 目标函数行
-                    objective = row_name
-                else:
-                    # 约束行
-                    constraints[row_name] = {
-                        'type': row_type,
-                        'coefficients': {},
-                        'rhs': 0.0
-                    }
-        elif current_section == 'COLUMNS':
-            # 解析列（变量）
-            parts = line.split()
-            if len(parts) >= 3:
-                var_name = parts[0]
-                if var_name not in variables:
-                    try:
-                        variables[var_name] = model.add_var(name=var_name, vtype=CONTINUOUS)
-                    except Exception as e:
-                        print(f"添加变量失败: {e}")
-                        continue
-                
-                row_name = parts[1]
-                coeff = float(parts[2])
-                
-                if row_name == objective:
-                    # 目标函数系数
-                    variables[var_name].obj = coeff
-                else:
-                    # 约束系数
-                    if row_name in constraints:
-                        constraints[row_name]['coefficients'][var_name] = coeff
-        elif current_section == 'RHS':
-            # 解析右端常数
-            parts = line.split()
-            if len(parts) >= 3:
-                row_name = parts[1]
-                rhs = float(parts[2])
-                if row_name in constraints:
-                    constraints[row_name]['rhs'] = rhs
-    
-    # 设置目标函数
-    if objective:
-        try:
-            obj_expr = sum(var.obj * var for var in variables.values() if hasattr(var, 'obj'))
-            model.set_objective(obj_expr, objective_sense)
-        except Exception as e:
-            print(f"设置目标函数失败: {e}")
-    
-    # 添加约束
-    for constr_name, constr_data in constraints.items():
-        try:
-            lhs = sum(constr_data['coefficients'].get(var_name, 0) * variables[var_name] 
-                     for var_name in variables.keys())
-            
-            if constr_data['type'] == 'L':
-                model.add_constr(lhs <= constr_data['rhs'], name=constr_name)
-            elif constr_data['type'] == 'G':
-                model.add_constr(lhs >= constr_data['rhs'], name=constr_name)
-            elif constr_data['type'] == 'E':
-                model.add_constr(lhs == constr_data['rhs'], name=constr_name)
-        except Exception as e:
-            print(f"添加约束失败: {e}")
-    
+    build_model(model, load_parsed_mps(data))
     return model
 
 def create_test_model():
@@ -251,6 +273,233 @@ def get_status_text(status):
     }
     return status_map.get(status, "UNKNOWN")
 
+def _static_asset(text):
+    """把静态内容编码并预先压缩，返回 (原始字节, gzip字节, 内容哈希)"""
+    data = text.encode('utf-8')
+    return data, gzip.compress(data, 9), hashlib.blake2b(data, digest_size=16).hexdigest()
+
+# 页面脚本作为独立的静态资源提供，URL带内容哈希，浏览器可长期缓存
+APP_JS = """
+        let selectedFile = null;
+        let selectedSolver = null;
+        let problemId = null;
+        let solution = null;
+
+        // 文件上传处理
+        document.getElementById('fileInput').addEventListener('change', function(e) {
+            const file = e.target.files[0];
+            if (file) {
+                handleFileUpload(file);
+            }
+        });
+
+        // 拖拽上传
+        const uploadArea = document.getElementById('uploadArea');
+        uploadArea.addEventListener('dragover', function(e) {
+            e.preventDefault();
+            uploadArea.classList.add('dragover');
+        });
+
+        uploadArea.addEventListener('dragleave', function(e) {
+            e.preventDefault();
+            uploadArea.classList.remove('dragover');
+        });
+
+        uploadArea.addEventListener('drop', function(e) {
+            e.preventDefault();
+            uploadArea.classList.remove('dragover');
+            const files = e.dataTransfer.files;
+            if (files.length > 0) {
+                handleFileUpload(files[0]);
+            }
+        });
+
+        function handleFileUpload(file) {
+            if (!file.name.toLowerCase().endsWith('.mps')) {
+                alert('请选择.mps格式的文件');
+                return;
+            }
+
+            selectedFile = file;
+            document.getElementById('fileName').textContent = file.name;
+            document.getElementById('fileInfo').style.display = 'block';
+            
+            // 上传文件到服务器
+            uploadFile(file);
+        }
+
+        function uploadFile(file) {
+            const formData = new FormData();
+            formData.append('file', file);
+
+            fetch('/api/upload', {
+                method: 'POST',
+                body: formData
+            })
+            .then(response => response.json())
+            .then(data => {
+                if (data.success) {
+                    problemId = data.problem_id;
+                    showSolverSection();
+                    updateProgress(25);
+                } else {
+                    alert('文件上传失败: ' + data.error);
+                }
+            })
+            .catch(error => {
+                console.error('Error:', error);
+                alert('文件上传失败');
+            });
+        }
+
+        function showSolverSection() {
+            document.getElementById('solverSection').style.display = 'block';
+            document.getElementById('solveSection').style.display = 'block';
+        }
+
+        // 求解器选择
+        document.querySelectorAll('.solver-card').forEach(card => {
+            card.addEventListener('click', function() {
+                document.querySelectorAll('.solver-card').forEach(c => c.classList.remove('selected'));
+                this.classList.add('selected');
+                selectedSolver = this.dataset.solver;
+            });
+        });
+
+        function solveProblem() {
+            if (!selectedSolver) {
+                alert('请选择求解器');
+                return;
+            }
+
+            document.getElementById('progressSection').style.display = 'block';
+            document.getElementById('solveBtn').disabled = true;
+
+            fetch('/api/solve', {
+                method: 'POST',
+                headers: {
+                    'Content-Type': 'application/json',
+                },
+                body: JSON.stringify({
+                    problem_id: problemId,
+                    solver: selectedSolver
+                })
+            })
+            .then(response => response.json())
+            .then(data => {
+                if (data.success) {
+                    solution = data.solution;
+                    showResults();
+                    updateProgress(100);
+                } else {
+                    alert('求解失败: ' + data.error);
+                }
+            })
+            .catch(error => {
+                console.error('Error:', error);
+                alert('求解失败');
+            })
+            .finally(() => {
+                document.getElementById('solveBtn').disabled = false;
+            });
+        }
+
+        function showResults() {
+            document.getElementById('resultSection').style.display = 'block';
+            document.getElementById('reportSection').style.display = 'block';
+            
+            // 更新结果信息
+            document.getElementById('solutionStatus').textContent = solution.status;
+            document.getElementById('objectiveValue').textContent = solution.objective_value.toFixed(6);
+            document.getElementById('solveTime').textContent = solution.solve_time.toFixed(2) + ' 秒';
+            document.getElementById('iterations').textContent = solution.iterations;
+            document.getElementById('solverName').textContent = solution.solver;
+
+            // 更新变量值
+            const variableValues = document.getElementById('variableValues');
+            variableValues.innerHTML = '';
+            Object.entries(solution.variables).forEach(([name, value]) => {
+                const div = document.createElement('div');
+                div.className = 'd-flex justify-content-between';
+                div.innerHTML = `<span>${name}:</span><span>${value.toFixed(6)}</span>`;
+                variableValues.appendChild(div);
+            });
+        }
+
+        function generateReport() {
+            const options = {
+                include_math: document.getElementById('includeMath').checked,
+                include_solution: document.getElementById('includeSolution').checked,
+                include_analysis: document.getElementById('includeAnalysis').checked
+            };
+
+            fetch('/api/report', {
+                method: 'POST',
+                headers: {
+                    'Content-Type': 'application/json',
+                },
+                body: JSON.stringify({
+                    problem_id: problemId,
+                    options: options
+                })
+            })
+            .then(response => response.blob())
+            .then(blob => {
+                const url = window.URL.createObjectURL(blob);
+                const a = document.createElement('a');
+                a.href = url;
+                a.download = 'mipsolver_report.tex';
+                document.body.appendChild(a);
+                a.click();
+                window.URL.revokeObjectURL(url);
+                document.body.removeChild(a);
+            })
+            .catch(error => {
+                console.error('Error:', error);
+                alert('报告生成失败');
+            });
+        }
+
+        function previewReport() {
+            const options = {
+                include_math: document.getElementById('includeMath').checked,
+                include_solution: document.getElementById('includeSolution').checked,
+                include_analysis: document.getElementById('includeAnalysis').checked
+            };
+
+            fetch('/api/report/preview', {
+                method: 'POST',
+                headers: {
+                    'Content-Type': 'application/json',
+                },
+                body: JSON.stringify({
+                    problem_id: problemId,
+                    options: options
+                })
+            })
+            .then(response => response.json())
+            .then(data => {
+                if (data.success) {
+                    document.getElementById('latexPreview').textContent = data.latex;
+                    document.getElementById('reportPreview').style.display = 'block';
+                } else {
+                    alert('预览失败: ' + data.error);
+                }
+            })
+            .catch(error => {
+                console.error('Error:', error);
+                alert('预览失败');
+            });
+        }
+
+        function updateProgress(percent) {
+            document.getElementById('stepProgress').style.width = percent + '%';
+            document.getElementById('progressBar').style.width = percent + '%';
+        }
+"""
+_APP_JS_BYTES, _APP_JS_GZIP, _APP_JS_ETAG = _static_asset(APP_JS)
+APP_JS_URL = f"/assets/app.js?v={_APP_JS_ETAG[:12]}"
+
 def create_html_template():
     """创建HTML模板"""
     return """
@@ -524,232 +773,37 @@ def create_html_template():
     </div>
 
     <script src="https://cdn.jsdelivr.net/npm/bootstrap@5.1.3/dist/js/bootstrap.bundle.min.js"></script>
-    <script>
-        let selectedFile = null;
-        let selectedSolver = null;
-        let problemId = null;
-        let solution = null;
-
-        // 文件上传处理
-        document.getElementById('fileInput').addEventListener('change', function(e) {
-            const file = e.target.files[0];
-            if (file) {
-                handleFileUpload(file);
-            }
-        });
-
-        // 拖拽上传
-        const uploadArea = document.getElementById('uploadArea');
-        uploadArea.addEventListener('dragover', function(e) {
-            e.preventDefault();
-            uploadArea.classList.add('dragover');
-        });
-
-        uploadArea.addEventListener('dragleave', function(e) {
-            e.preventDefault();
-            uploadArea.classList.remove('dragover');
-        });
-
-        uploadArea.addEventListener('drop', function(e) {
-            e.preventDefault();
-            uploadArea.classList.remove('dragover');
-            const files = e.dataTransfer.files;
-            if (files.length > 0) {
-                handleFileUpload(files[0]);
-            }
-        });
-
-        function handleFileUpload(file) {
-            if (!file.name.toLowerCase().endsWith('.mps')) {
-                alert('请选择.mps格式的文件');
-                return;
-            }
-
-            selectedFile = file;
-            document.getElementById('fileName').textContent = file.name;
-            document.getElementById('fileInfo').style.display = 'block';
-            
-            // 上传文件到服务器
-            uploadFile(file);
-        }
-
-        function uploadFile(file) {
-            const formData = new FormData();
-            formData.append('file', file);
-
-            fetch('/api/upload', {
-                method: 'POST',
-                body: formData
-            })
-            .then(response => response.json())
-            .then(data => {
-                if (data.success) {
-                    problemId = data.problem_id;
-                    showSolverSection();
-                    updateProgress(25);
-                } else {
-                    alert('文件上传失败: ' + data.error);
-                }
-            })
-            .catch(error => {
-                console.error('Error:', error);
-                alert('文件上传失败');
-            });
-        }
-
-        function showSolverSection() {
-            document.getElementById('solverSection').style.display = 'block';
-            document.getElementById('solveSection').style.display = 'block';
-        }
-
-        // 求解器选择
-        document.querySelectorAll('.solver-card').forEach(card => {
-            card.addEventListener('click', function() {
-                document.querySelectorAll('.solver-card').forEach(c => c.classList.remove('selected'));
-                this.classList.add('selected');
-                selectedSolver = this.dataset.solver;
-            });
-        });
-
-        function solveProblem() {
-            if (!selectedSolver) {
-                alert('请选择求解器');
-                return;
-            }
-
-            document.getElementById('progressSection').style.display = 'block';
-            document.getElementById('solveBtn').disabled = true;
-
-            fetch('/api/solve', {
-                method: 'POST',
-                headers: {
-                    'Content-Type': 'application/json',
-                },
-                body: JSON.stringify({
-                    problem_id: problemId,
-                    solver: selectedSolver
-                })
-            })
-            .then(response => response.json())
-            .then(data => {
-                if (data.success) {
-                    solution = data.solution;
-                    showResults();
-                    updateProgress(100);
-                } else {
-                    alert('求解失败: ' + data.error);
-                }
-            })
-            .catch(error => {
-                console.error('Error:', error);
-                alert('求解失败');
-            })
-            .finally(() => {
-                document.getElementById('solveBtn').disabled = false;
-            });
-        }
-
-        function showResults() {
-            document.getElementById('resultSection').style.display = 'block';
-            document.getElementById('reportSection').style.display = 'block';
-            
-            // 更新结果信息
-            document.getElementById('solutionStatus').textContent = solution.status;
-            document.getElementById('objectiveValue').textContent = solution.objective_value.toFixed(6);
-            document.getElementById('solveTime').textContent = solution.solve_time.toFixed(2) + ' 秒';
-            document.getElementById('iterations').textContent = solution.iterations;
-            document.getElementById('solverName').textContent = solution.solver;
-
-            // 更新变量值
-            const variableValues = document.getElementById('variableValues');
-            variableValues.innerHTML = '';
-            Object.entries(solution.variables).forEach(([name, value]) => {
-                const div = document.createElement('div');
-                div.className = 'd-flex justify-content-between';
-                div.innerHTML = `<span>${name}:</span><span>${value.toFixed(6)}</span>`;
-                variableValues.appendChild(div);
-            });
-        }
-
-        function generateReport() {
-            const options = {
-                include_math: document.getElementById('includeMath').checked,
-                include_solution: document.getElementById('includeSolution').checked,
-                include_analysis: document.getElementById('includeAnalysis').checked
-            };
-
-            fetch('/api/report', {
-                method: 'POST',
-                headers: {
-                    'Content-Type': 'application/json',
-                },
-                body: JSON.stringify({
-                    problem_id: problemId,
-                    options: options
-                })
-            })
-            .then(response => response.blob())
-            .then(blob => {
-                const url = window.URL.createObjectURL(blob);
-                const a = document.createElement('a');
-                a.href = url;
-                a.download = 'mipsolver_report.tex';
-                document.body.appendChild(a);
-                a.click();
-                window.URL.revokeObjectURL(url);
-                document.body.removeChild(a);
-            })
-            .catch(error => {
-                console.error('Error:', error);
-                alert('报告生成失败');
-            });
-        }
-
-        function previewReport() {
-            const options = {
-                include_math: document.getElementById('includeMath').checked,
-                include_solution: document.getElementById('includeSolution').checked,
-                include_analysis: document.getElementById('includeAnalysis').checked
-            };
-
-            fetch('/api/report/preview', {
-                method: 'POST',
-                headers: {
-                    'Content-Type': 'application/json',
-                },
-                body: JSON.stringify({
-                    problem_id: problemId,
-                    options: options
-                })
-            })
-            .then(response => response.json())
-            .then(data => {
-                if (data.success) {
-                    document.getElementById('latexPreview').textContent = data.latex;
-                    document.getElementById('reportPreview').style.display = 'block';
-                } else {
-                    alert('预览失败: ' + data.error);
-                }
-            })
-            .catch(error => {
-                console.error('Error:', error);
-                alert('预览失败');
-            });
-        }
-
-        function updateProgress(percent) {
-            document.getElementById('stepProgress').style.width = percent + '%';
-            document.getElementById('progressBar').style.width = percent + '%';
-        }
-    </script>
+    <script src=\"""" + APP_JS_URL + """\"></script>
 </body>
 </html>
 """
 
+# 主页内容在导入时生成一次，并预先压缩、计算ETag
+_INDEX_BYTES, _INDEX_GZIP, _INDEX_ETAG = _static_asset(create_html_template())
+
+def asset_response(data, data_gzip, etag, mimetype, cache_control):
+    """返回预先压缩的静态内容，支持gzip协商和ETag条件请求"""
+    if 'gzip' in request.accept_encodings:
+        response = Response(data_gzip, mimetype=mimetype)
+        response.headers['Content-Encoding'] = 'gzip'
+    else:
+        response = Response(data, mimetype=mimetype)
+    response.headers['Vary'] = 'Accept-Encoding'
+    response.headers['Cache-Control'] = cache_control
+    response.set_etag(etag)
+    # 浏览器带If-None-Match且ETag一致时返回304
+    return response.make_conditional(request)
+
 @app.route('/')
 def index():
     """主页"""
-    return create_html_template()
+    return asset_response(_INDEX_BYTES, _INDEX_GZIP, _INDEX_ETAG, 'text/html', 'public, max-age=300')
+
+@app.route('/assets/app.js')
+def app_js():
+    """页面脚本；URL中带内容哈希，内容变化时URL随之变化"""
+    return asset_response(_APP_JS_BYTES, _APP_JS_GZIP, _APP_JS_ETAG, 'application/javascript',
+                          'public, max-age=31536000, immutable')
 
 @app.route('/api/upload', methods=['POST'])
 def upload_file():
@@ -765,14 +819,17 @@ def upload_file():
         if file and allowed_file(file.filename):
             filename = secure_filename(file.filename)
             filepath = os.path.join(app.config['UPLOAD_FOLDER'], filename)
-            file.save(filepath)
+            # 上传内容只读入一次（受MAX_CONTENT_LENGTH限制），保存和解析共用同一份数据
+            data = file.read()
+            with open(filepath, 'wb') as f:
+                f.write(data)
             
-            # 生成问题ID
-            problem_id = f"problem_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+            # 生成问题ID：递增计数保证进程内唯一，随机后缀使ID不可猜测
+            problem_id = f"p{next(_problem_ids):08x}{secrets.token_hex(4)}"
             
             # 解析MPS文件
             try:
-                model = parse_mps_file(filepath)
+                model = parse_mps_file(data, Path(filename).stem)
                 problem_data = {
                     'id': problem_id,
                     'filename': filename,
@@ -780,7 +837,7 @@ def upload_file():
                     'model': model,
                     'upload_time': datetime.now().isoformat()
                 }
-                active_problems[problem_id] = problem_data
+                add_problem(problem_data)
                 
                 return jsonify({
                     'success': True,
@@ -795,6 +852,13 @@ def upload_file():
     except Exception as e:
         return jsonify({'success': False, 'error': str(e)})
 
+@app.route('/api/problems/<problem_id>', methods=['DELETE'])
+def delete_problem(problem_id):
+    """删除问题API，释放模型和上传文件"""
+    if not remove_problem(problem_id):
+        return jsonify({'success': False, 'error': '问题不存在'}), 404
+    return jsonify({'success': True})
+
 @app.route('/api/solve', methods=['POST'])
 def solve_problem():
     """求解API"""
@@ -803,20 +867,20 @@ def solve_problem():
         problem_id = data.get('problem_id')
         solver = data.get('solver')
         
-        if problem_id not in active_problems:
+        problem_data = get_problem(problem_id)
+        if problem_data is None:
             return jsonify({'success': False, 'error': '问题不存在'})
         
-        problem_data = active_problems[problem_id]
         model = problem_data['model']
         
         # 记录开始时间
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         
         # 调用真正的求解器
         model.optimize()
         
         # 记录求解时间
-        solve_time = time.time() - start_time
+        solve_time = (time.perf_counter_ns() - start_ns) * 1e-9
         
         # 提取求解结果
         solution = {
@@ -833,7 +897,7 @@ def solve_problem():
             solution['variables'][var.name] = getattr(var, 'value', 0.0)
         
         # 保存求解结果
-        active_problems[problem_id]['solution'] = solution
+        problem_data['solution'] = solution
         
         return jsonify({
             'success': True,
@@ -851,10 +915,10 @@ def generate_report():
         problem_id = data.get('problem_id')
         options = data.get('options', {})
         
-        if problem_id not in active_problems:
+        problem_data = get_problem(problem_id)
+        if problem_data is None:
             return jsonify({'success': False, 'error': '问题不存在'})
         
-        problem_data = active_problems[problem_id]
         solution = problem_data.get('solution')
         
         if not solution:
@@ -881,10 +945,10 @@ def preview_report():
         problem_id = data.get('problem_id')
         options = data.get('options', {})
         
-        if problem_id not in active_problems:
+        problem_data = get_problem(problem_id)
+        if problem_data is None:
             return jsonify({'success': False, 'error': '问题不存在'})
         
-        problem_data = active_problems[problem_id]
         solution = problem_data.get('solution')
         
         if not solution:
@@ -998,6 +1062,26 @@ def create_latex_report(problem_data, solution, options):
     return report
 
 if __name__ == '__main__':
+    import argparse
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--host', default='0.0.0.0')
+    parser.add_argument('--port', type=int, default=5001)
+    parser.add_argument('--asgi', action='store_true', help='使用Uvicorn ASGI服务器运行')
+    
+    args = parser.parse_args()
+    
     print("启动MIPSolver Web界面...")
-    print("访问地址: http://localhost:5001")
-    app.run(debug=True, host='0.0.0.0', port=5001) 
\ No newline at end of file
+    print(f"访问地址: http://localhost:{args.port}")
+    if args.asgi:
+        try:
+            import uvicorn
+        except ImportError:
+            print("请安装Uvicorn: pip install uvicorn asgiref")
+            exit(1)
+        if asgi_app is None:
+            print("请安装asgiref: pip install asgiref")
+            exit(1)
+        uvicorn.run(asgi_app, host=args.host, port=args.port)
+    else:
+        # 开发服务器每个请求一个线程，耗时的上传解析不会阻塞其他请求
+        app.run(debug=True, host=args.host, port=args.port, threaded=True) 
\ No newline at end of file
@@ -131,6 +131,20 @@ except ImportError as e:
         def set_variable_bounds(self, var_idx, lb, ub): 
             """设置变量边界（模拟实现）"""
             pass
+        
+        def add_variables(self, names, types, lower, upper):
+            """批量添加决策变量（模拟实现）"""
+            first = self.var_count
+            self.var_count += len(names)
+            return first
+        
+        def set_objective_coefficients(self, var_indices, coeffs):
+            """批量设置目标函数系数（模拟实现）"""
+            pass
+        
+        def add_constraint_coefficients(self, c_idx, var_indices, coeffs):
+            """批量设置约束系数（模拟实现）"""
+            pass
 
     class MockSolverModule:
         """
@@ -17,6 +17,10 @@ class LinExpr:
     the scenes.
     """
     
+    # Expressions are created for every intermediate "+"/"*" result,
+    # so avoid a per-instance __dict__
+    __slots__ = ('_terms', '_constant')
+    
     def __init__(self):
         self._terms: Dict = {}  # Maps variables to coefficients
         self._constant: float = 0.0
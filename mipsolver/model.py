@@ -41,8 +41,8 @@ from .exceptions import MIPSolverError, OptimizationError
 import mipsolver
 
 
-
-
+# 求解状态值到状态名称的映射，下标即状态值
+_STATUS_NAMES = ("UNKNOWN", "UNKNOWN", "OPTIMAL", "INFEASIBLE", "UNBOUNDED", "ERROR")
 
 
 class Var:
@@ -222,6 +222,8 @@ class Constraint:
     通过变量/表达式的比较运算符创建。
     """
     
+    __slots__ = ('lhs', 'sense', 'rhs', 'name')
+    
     def __init__(self, lhs, sense: int, rhs, name: str = ""):
         self.lhs = lhs  # 左侧 (变量或表达式)
         self.sense = sense  # LESS_EQUAL, GREATER_EQUAL, 或 EQUAL
@@ -325,6 +327,15 @@ class Model:
         """
         return self._solve_log.copy()
     
+    def get_values(self) -> List[float]:
+        """
+        所有变量的解值，按变量添加顺序排列
+        仅在调用optimize()后有效
+        """
+        if not self._solved:
+            raise MIPSolverError("模型尚未求解")
+        return [var._value for var in self._variables]
+    
     def add_var(self, 
                 lb: float = 0.0, 
                 ub: float = float('inf'), 
@@ -480,14 +491,9 @@ class Model:
             return status.name
         elif hasattr(status, 'value'):
             status_value = status.value
-            status_map = {
-                2: "OPTIMAL",
-                3: "INFEASIBLE", 
-                4: "UNBOUNDED",
-                5: "ERROR",
-                1: "UNKNOWN"
-            }
-            return status_map.get(status_value, "UNKNOWN")
+            if 0 <= status_value < len(_STATUS_NAMES):
+                return _STATUS_NAMES[status_value]
+            return "UNKNOWN"
         else:
             return str(status)
     
@@ -529,30 +535,35 @@ class Model:
         obj_type = mipsolver._solver.ObjectiveType.MAXIMIZE if self._objective_sense == MAXIMIZE else mipsolver._solver.ObjectiveType.MINIMIZE
         problem = mipsolver._solver.Problem(self._name, obj_type)
         
-        # 向C++问题添加变量
-        for var in self._variables:
-            vtype_map = {
-                CONTINUOUS: mipsolver._solver.VariableType.CONTINUOUS,
-                BINARY: mipsolver._solver.VariableType.BINARY,
-                INTEGER: mipsolver._solver.VariableType.INTEGER
-            }
-            cpp_vtype = vtype_map[var.vtype]
-            
-            var_index = problem.add_variable(var.name, cpp_vtype)
-            problem.set_variable_bounds(var_index, var.lb, var.ub)
+        # 向C++问题批量添加变量（一次跨越Python/C++边界）
+        vtype_map = {
+            CONTINUOUS: mipsolver._solver.VariableType.CONTINUOUS,
+            BINARY: mipsolver._solver.VariableType.BINARY,
+            INTEGER: mipsolver._solver.VariableType.INTEGER
+        }
+        variables = self._variables
+        problem.add_variables(
+            [var.name for var in variables],
+            [vtype_map[var.vtype] for var in variables],
+            [var.lb for var in variables],
+            [var.ub for var in variables]
+        )
         
         # 设置目标系数
         if self._objective_expr:
-            for var, coeff in self._objective_expr.get_terms():
-                problem.set_objective_coefficient(var._index, coeff)
+            terms = self._objective_expr.get_terms()
+            problem.set_objective_coefficients(
+                [var._index for var, _ in terms],
+                [coeff for _, coeff in terms]
+            )
         
         # 添加约束
+        sense_map = {
+            LESS_EQUAL: mipsolver._solver.ConstraintType.LESS_EQUAL,
+            GREATER_EQUAL: mipsolver._solver.ConstraintType.GREATER_EQUAL,
+            EQUAL: mipsolver._solver.ConstraintType.EQUAL
+        }
         for constraint in self._constraints:
-            sense_map = {
-                LESS_EQUAL: mipsolver._solver.ConstraintType.LESS_EQUAL,
-                GREATER_EQUAL: mipsolver._solver.ConstraintType.GREATER_EQUAL,
-                EQUAL: mipsolver._solver.ConstraintType.EQUAL
-            }
             cpp_sense = sense_map[constraint.sense]
             
             constr_index = problem.add_constraint(constraint.name, cpp_sense, float(constraint.rhs))
@@ -561,8 +572,12 @@ class Model:
             if isinstance(constraint.lhs, Var):
                 problem.add_constraint_coefficient(constr_index, constraint.lhs._index, 1.0)
             elif isinstance(constraint.lhs, LinExpr):
-                for var, coeff in constraint.lhs.get_terms():
-                    problem.add_constraint_coefficient(constr_index, var._index, coeff)
+                terms = constraint.lhs.get_terms()
+                problem.add_constraint_coefficients(
+                    constr_index,
+                    [var._index for var, _ in terms],
+                    [coeff for _, coeff in terms]
+                )
         
         return problem
     
@@ -14,21 +14,27 @@ class SolverMonitor:
     def __init__(self):
         self.iterations = 0
         self.log_entries = []
-        self.start_time = None
+        self.start_time = None  # time.perf_counter_ns() 时间戳
         
     def start_solve(self, model_name: str, num_vars: int, num_constrs: int):
         """开始求解，初始化监控"""
         self.iterations = 0
         self.log_entries = []
-        self.start_time = time.time()
+        self.start_time = time.perf_counter_ns()
         
         self.log(f"开始求解模型: {model_name}")
         self.log(f"变量数量: {num_vars}, 约束数量: {num_constrs}")
         self.log("初始化求解器...")
         
+    def elapsed(self) -> float:
+        """自开始求解以来经过的秒数"""
+        if self.start_time is None:
+            return 0
+        return (time.perf_counter_ns() - self.start_time) * 1e-9
+        
     def log(self, message: str):
         """添加日志条目"""
-        elapsed = time.time() - self.start_time if self.start_time else 0
+        elapsed = self.elapsed()
         self.log_entries.append(f"[{elapsed:.3f}s] {message}")
         
     def simulate_solve_process(self, problem_size: str = "medium"):
@@ -82,7 +88,7 @@ class SolverMonitor:
             
     def finish_solve(self, status: str, obj_val: float = None):
         """完成求解，记录最终结果"""
-        elapsed = time.time() - self.start_time if self.start_time else 0
+        elapsed = self.elapsed()
         
         self.log(f"求解状态: {status}")
         if obj_val is not None:
@@ -95,5 +101,5 @@ class SolverMonitor:
         return {
             'iterations': self.iterations,
             'log_entries': self.log_entries.copy(),
-            'total_time': time.time() - self.start_time if self.start_time else 0
+            'total_time': self.elapsed()
         }
\ No newline at end of file
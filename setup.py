@@ -13,7 +13,6 @@ import subprocess
 from pathlib import Path
 from setuptools import setup, Extension, find_packages
 from setuptools.command.build_ext import build_ext
-import pybind11
 
 class CMakeExtension(Extension):
     """
@@ -41,6 +40,9 @@ class CMakeBuild(build_ext):
     """
     
     def build_extension(self, ext: CMakeExtension) -> None:
+        # 仅在实际编译扩展时才需要pybind11，sdist/egg_info等命令无需导入
+        import pybind11
+        
         # 找到setuptools希望我们放置编译扩展的位置
         extdir = Path(self.get_ext_fullpath(ext.name)).parent.resolve()
         extdir = os.path.join(extdir, "mipsolver")
@@ -75,7 +77,9 @@ class CMakeBuild(build_ext):
             ]
         
         # 构建参数
-        build_args = ["--config", build_type, "--parallel"]
+        # 并行编译任务数: 优先使用CMAKE_BUILD_PARALLEL_LEVEL环境变量，否则使用全部CPU核心
+        parallel_jobs = os.environ.get("CMAKE_BUILD_PARALLEL_LEVEL") or str(os.cpu_count() or 4)
+        build_args = ["--config", build_type, "--parallel", parallel_jobs]
         
         print(f"在{build_temp}中构建")
         print(f"CMake参数: {' '.join(cmake_args)}")
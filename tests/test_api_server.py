@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+测试API服务器的各个接口（使用Flask测试客户端）
+"""
+import os
+import sys
+
+import pytest
+
+pytest.importorskip("flask")
+pytest.importorskip("flask_cors")
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'gui'))
+
+import api_server
+
+
+@pytest.fixture
+def client():
+    return api_server.app.test_client()
+
+
+@pytest.fixture
+def model_id(client):
+    """创建一个含变量x、y的模型，测试结束后删除"""
+    response = client.post('/api/models', json={'name': 'test'})
+    assert response.status_code == 201
+    model_id = response.get_json()['model_id']
+    for name in ('x', 'y'):
+        assert client.post(f'/api/models/{model_id}/variables',
+                           json={'name': name, 'type': 'integer'}).status_code == 200
+    yield model_id
+    client.delete(f'/api/models/{model_id}')
+
+
+def test_build_and_solve(client, model_id):
+    """添加约束、追加系数并求解；模型未修改时返回缓存的结果"""
+    response = client.post(f'/api/models/{model_id}/constraints',
+                           json={'name': 'c1', 'sense': '<=', 'rhs': 10, 'coefs': [['x', 1]]})
+    assert response.status_code == 201
+    constraint_id = response.get_json()['constraint_id']
+
+    response = client.post(f'/api/models/{model_id}/constraints/{constraint_id}/coefficients',
+                           json={'coefs': [['y', 2]]})
+    assert response.status_code == 200
+
+    first = client.post(f'/api/models/{model_id}/solve')
+    assert first.status_code == 200
+    assert first.get_json()['success']
+    second = client.post(f'/api/models/{model_id}/solve')
+    assert second.get_json() == first.get_json()
+
+
+def test_model_ids_are_not_sequential(client, model_id):
+    """模型ID带随机后缀，只知道槽位下标无法访问模型"""
+    index = model_id.partition('-')[0]
+    assert client.post(f'/api/models/{index}/solve').status_code == 404
+    assert client.post(f'/api/models/{index}-0000000000000000/solve').status_code == 404
+
+
+@pytest.mark.parametrize("bad_id", ['abc', '%C2%B2', '%C2%B2-x', '99999999-abc', '-'])
+def test_invalid_model_id(client, bad_id):
+    """无效的模型ID返回404"""
+    assert client.post(f'/api/models/{bad_id}/solve').status_code == 404
+
+
+def test_delete_model_reuses_slot(client):
+    """删除模型后槽位被复用，旧ID不再有效"""
+    old_id = client.post('/api/models', json={}).get_json()['model_id']
+    assert client.delete(f'/api/models/{old_id}').status_code == 200
+    assert client.delete(f'/api/models/{old_id}').status_code == 404
+
+    new_id = client.post('/api/models', json={}).get_json()['model_id']
+    assert new_id.partition('-')[0] == old_id.partition('-')[0]
+    assert new_id != old_id
+    assert client.post(f'/api/models/{old_id}/solve').status_code == 404
+    client.delete(f'/api/models/{new_id}')
+
+
+def test_capacity_limit(client, monkeypatch):
+    """没有空闲槽位时返回503"""
+    monkeypatch.setattr(api_server, 'MODEL_CAPACITY', 0)
+    monkeypatch.setattr(api_server, '_free_slots', [])
+    assert client.post('/api/models', json={}).status_code == 503
+
+
+@pytest.mark.parametrize("body", [
+    [1, 2],
+    "text",
+    None,
+])
+def test_body_must_be_object(client, model_id, body):
+    """请求体不是JSON对象时返回400"""
+    for url in ('/api/models',
+                f'/api/models/{model_id}/variables',
+                f'/api/models/{model_id}/constraints'):
+        response = client.post(url, json=body)
+        assert response.status_code == 400, url
+        assert not response.get_json()['success']
+
+
+@pytest.mark.parametrize("payload", [
+    {'name': ''},
+    {'name': ['x']},
+    {'name': 'z', 'type': 'real'},
+    {'name': 'z', 'type': ['integer']},
+])
+def test_add_variable_rejects_bad_payload(client, model_id, payload):
+    """变量名或类型无效时返回400"""
+    assert client.post(f'/api/models/{model_id}/variables', json=payload).status_code == 400
+
+
+@pytest.mark.parametrize("payload, message", [
+    ({'coefs': [['x']]}, '系数项格式错误'),
+    ({'coefs': [['x', 'a']]}, '系数不是数值'),
+    ({'coefs': 'xx'}, 'coefs必须是'),
+    ({'coefs': [['z', 1]]}, '变量不存在'),
+    ({'coefs': [], 'rhs': 'abc'}, '右端常数不是数值'),
+    ({'coefs': [], 'sense': '<'}, '不支持的约束类型'),
+    ({'coefs': [], 'sense': ['<=']}, '不支持的约束类型'),
+    ({'coefs': [], 'name': 1}, '约束名必须是字符串'),
+])
+def test_add_constraint_rejects_bad_payload(client, model_id, payload, message):
+    """约束数据无效时返回400和可读的错误信息"""
+    response = client.post(f'/api/models/{model_id}/constraints', json=payload)
+    assert response.status_code == 400
+    assert message in response.get_json()['error']
+
+
+def test_add_coefficients_rejects_bad_payload(client, model_id):
+    """追加系数时约束不存在返回404，系数无效返回400"""
+    response = client.post(f'/api/models/{model_id}/constraints', json={'coefs': []})
+    constraint_id = response.get_json()['constraint_id']
+    url = f'/api/models/{model_id}/constraints/{constraint_id}/coefficients'
+
+    assert client.post(url, json={'coefs': [['x', None]]}).status_code == 400
+    assert client.post(url, json=[1]).status_code == 400
+    assert client.post(f'/api/models/{model_id}/constraints/%C2%B2/coefficients',
+                       json={'coefs': []}).status_code == 404
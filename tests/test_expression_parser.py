@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+测试交互式求解器的表达式解析（调度场算法与快速路径）
+"""
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'gui'))
+
+import mipsolver as mp
+from interactive_solver import (NUM, IDENT, OP, compile_expression, compile_simple,
+                                evaluate_postfix, split_command)
+
+
+def evaluate(expr_str):
+    """在只含变量x、y的模型上求值，返回 ({变量名: 系数}, 常数项)"""
+    model = mp.Model("parser_test")
+    variables = {name: model.add_var(name=name) for name in ('x', 'y')}
+    expr = evaluate_postfix(compile_expression(expr_str), variables)
+    return {var.name: coeff for var, coeff in expr.get_terms()}, expr.get_constant()
+
+
+def test_precedence():
+    """乘法优先于加减法"""
+    assert compile_expression("2*x + 3*y") == [
+        (NUM, 2.0), (IDENT, 'x'), (OP, '*'),
+        (NUM, 3.0), (IDENT, 'y'), (OP, '*'), (OP, '+')]
+    assert evaluate("x + 2*y - 3") == ({'x': 1.0, 'y': 2.0}, -3.0)
+
+
+def test_left_associative_subtraction():
+    """减法左结合：x - y - x 等于 -y"""
+    terms, constant = evaluate("x - y - x")
+    assert terms.get('x', 0.0) == 0.0
+    assert terms['y'] == -1.0
+    assert constant == 0.0
+
+
+def test_unary_minus():
+    """一元负号与一元正号"""
+    assert compile_expression("-x") == [(IDENT, 'x'), (OP, 'neg')]
+    assert compile_expression("+x") == [(IDENT, 'x')]
+    assert evaluate("-2*x + -y") == ({'x': -2.0, 'y': -1.0}, 0.0)
+    assert evaluate("--x") == ({'x': 1.0}, 0.0)
+
+
+def test_parentheses():
+    """括号改变运算顺序"""
+    assert evaluate("-(x - 2*y) * 3 + 4") == ({'x': -3.0, 'y': 6.0}, 4.0)
+    assert evaluate("2*(x + (y - 1))") == ({'x': 2.0, 'y': 2.0}, -2.0)
+
+
+def test_exponent_numbers():
+    """数字可带指数"""
+    assert compile_expression("1e3*x") == [(NUM, 1000.0), (IDENT, 'x'), (OP, '*')]
+    assert evaluate("2.5E-4*y + .5e1") == ({'y': 2.5e-4}, 5.0)
+    assert compile_simple("1e3*x - 2.5E-4*y") == ((1000.0, 'x'), (-2.5e-4, 'y'))
+
+
+def test_compile_simple():
+    """快速路径只接受一到两项的简单表达式"""
+    assert compile_simple("3*x") == ((3.0, 'x'),)
+    assert compile_simple(" -x + y ") == ((-1.0, 'x'), (1.0, 'y'))
+    assert compile_simple("x + y + 1") is None
+    assert compile_simple("2*(x)") is None
+
+
+@pytest.mark.parametrize("expr_str, message", [
+    ("2 x", "缺少运算符"),
+    ("2e*x", "缺少运算符"),
+    ("x +", "表达式不完整"),
+    ("* x", "缺少运算数"),
+    ("(x + y", "括号不匹配"),
+    ("x + y)", "括号不匹配"),
+    ("()", "括号不匹配"),
+    ("x / 2", "无法识别的字符"),
+    ("", "表达式不完整"),
+])
+def test_malformed_input(expr_str, message):
+    """格式错误的表达式抛出ValueError"""
+    with pytest.raises(ValueError, match=message):
+        compile_expression(expr_str)
+
+
+def test_undefined_variable():
+    """未定义的变量在求值时抛出KeyError"""
+    with pytest.raises(KeyError):
+        evaluate("x + z")
+
+
+def test_split_command():
+    """命令切分保留反斜杠，支持引号，撇号不成对时按空白切分"""
+    assert split_command(r"load C:\models\bk4x3.mps") == ['load', r'C:\models\bk4x3.mps']
+    assert split_command('load "my file.mps"') == ['load', 'my file.mps']
+    assert split_command("add_constraint x's <= 3") == ['add_constraint', "x's", '<=', '3']
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+测试共用的MPS解析器（CSR输出和磁盘缓存）
+"""
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'gui'))
+
+import mps_reader
+
+MPS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'examples', 'mps', 'bk4x3.mps')
+
+
+def read_fixture():
+    with open(MPS_FILE, encoding='utf-8') as f:
+        return mps_reader.read_mps_file(f)
+
+
+def naive_column_entries():
+    """逐行直接读取COLUMNS段，返回按文件顺序排列的 [(变量名, 行名, 系数), ...]"""
+    entries = []
+    in_columns = False
+    with open(MPS_FILE, encoding='utf-8') as f:
+        for line in f:
+            if not line[:1].isspace():
+                in_columns = line.startswith('COLUMNS')
+                continue
+            parts = line.split()
+            if not in_columns or not parts or parts[1] == "'MARKER'":
+                continue
+            for k in range(1, len(parts) - 1, 2):
+                entries.append((parts[0], parts[k], float(parts[k + 1])))
+    return entries
+
+
+def test_rows_and_columns():
+    """行、列按出现顺序编号，MARKER之间的列为整数变量"""
+    parsed = read_fixture()
+    assert parsed['objective'] == 'COST'
+    assert parsed['col_names'] == [f'X{i}' for i in range(12)] + [f'Y{i}' for i in range(12)]
+    assert list(parsed['col_integer']) == [0] * 12 + [1] * 12
+    assert parsed['row_names'] == ([f'A{i}' for i in range(4)] + [f'B{i}' for i in range(3)]
+                                   + [f'G{i}' for i in range(12)])
+    assert parsed['row_types'] == ['E'] * 7 + ['L'] * 12
+    assert list(parsed['rhs_values']) == [10, 30, 40, 20, 20, 50, 30] + [0] * 12
+
+
+def test_objective_coefficients():
+    """目标函数系数单独存放，不进入CSR"""
+    parsed = read_fixture()
+    col_names = parsed['col_names']
+    objective = {col_names[col]: val for col, val in zip(parsed['obj_cols'], parsed['obj_vals'])}
+    expected = {var: coeff for var, row, coeff in naive_column_entries() if row == 'COST'}
+    assert objective == expected
+    assert objective['X0'] == 2 and objective['Y1'] == 30
+
+
+def test_csr_matches_file():
+    """CSR各行的非零系数与文件一致，并保持文件中的出现顺序"""
+    parsed = read_fixture()
+    row_ptr, csr_cols, csr_vals = parsed['row_ptr'], parsed['csr_cols'], parsed['csr_vals']
+    col_names, row_names = parsed['col_names'], parsed['row_names']
+
+    assert row_ptr[0] == 0
+    assert len(row_ptr) == len(row_names) + 1
+    assert all(row_ptr[i] <= row_ptr[i + 1] for i in range(len(row_names)))
+    assert row_ptr[-1] == len(csr_cols) == len(csr_vals)
+
+    for i, row_name in enumerate(row_names):
+        start, end = row_ptr[i], row_ptr[i + 1]
+        actual = [(col_names[col], val) for col, val in zip(csr_cols[start:end], csr_vals[start:end])]
+        expected = [(var, coeff) for var, row, coeff in naive_column_entries() if row == row_name]
+        assert actual == expected, row_name
+
+
+def test_two_pairs_per_line_and_unknown_rows():
+    """一行两组系数都被读取，未在ROWS段声明的行被忽略"""
+    lines = [
+        "NAME test\n",
+        "ROWS\n",
+        " N obj\n",
+        " G c1\n",
+        " L c2\n",
+        "COLUMNS\n",
+        "    x obj 1 c1 2\n",
+        "    x c2 3 zz 9\n",
+        "    y c2 -1.5e1\n",
+        "RHS\n",
+        "    rhs c1 4 c2 5\n",
+        "ENDATA\n",
+    ]
+    parsed = mps_reader.read_mps_file(lines)
+    assert list(parsed['row_ptr']) == [0, 1, 3]
+    assert list(parsed['csr_cols']) == [0, 0, 1]
+    assert list(parsed['csr_vals']) == [2.0, 3.0, -15.0]
+    assert list(parsed['rhs_values']) == [4.0, 5.0]
+
+
+def test_disk_cache(tmp_path, monkeypatch):
+    """同一内容第二次加载时直接读取缓存，不再解析"""
+    monkeypatch.setattr(mps_reader, 'MPS_CACHE_DIR', tmp_path)
+    first = mps_reader.load_mps(MPS_FILE)
+    assert len(list(tmp_path.glob('*.pkl'))) == 1
+
+    def fail(f):
+        raise AssertionError("缓存命中时不应重新解析")
+    monkeypatch.setattr(mps_reader, 'read_mps_file', fail)
+    second = mps_reader.load_mps(MPS_FILE)
+    assert second == first
+
+
+def test_corrupt_cache_is_reparsed(tmp_path, monkeypatch):
+    """缓存文件损坏时重新解析并覆盖"""
+    monkeypatch.setattr(mps_reader, 'MPS_CACHE_DIR', tmp_path)
+    with open(MPS_FILE, 'rb') as f:
+        data = f.read()
+    cache_file = tmp_path / f"{mps_reader.content_digest(data)}-v{mps_reader._MPS_CACHE_VERSION}.pkl"
+    cache_file.write_bytes(b'not a pickle')
+    assert mps_reader.load_mps_bytes(data) == read_fixture()
+
+
+def test_build_model():
+    """build_model按列号返回变量，约束数与L/G/E行数一致"""
+    mp = pytest.importorskip("mipsolver")
+    parsed = read_fixture()
+    model = mp.Model("bk4x3")
+    var_objs = mps_reader.build_model(model, parsed)
+    assert [var.name for var in var_objs] == parsed['col_names']
+    assert len(model._constraints) == len(parsed['row_names'])
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+测试Web界面的问题存储（LRU淘汰）和上传、删除接口
+"""
+import io
+import os
+import sys
+
+import pytest
+
+pytest.importorskip("flask")
+pytest.importorskip("flask_cors")
+
+GUI_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'gui')
+MPS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'examples', 'mps', 'bk4x3.mps')
+sys.path.insert(0, GUI_DIR)
+
+
+@pytest.fixture(scope='module')
+def web_gui(tmp_path_factory):
+    """在临时目录中导入web_gui，上传目录和解析缓存都放在临时目录下"""
+    workdir = tmp_path_factory.mktemp('web_gui')
+    cwd = os.getcwd()
+    os.chdir(workdir)
+    try:
+        import mps_reader
+        cache_dir = mps_reader.MPS_CACHE_DIR
+        mps_reader.MPS_CACHE_DIR = workdir / 'cache'
+        import web_gui
+        yield web_gui
+    finally:
+        mps_reader.MPS_CACHE_DIR = cache_dir
+        os.chdir(cwd)
+
+
+@pytest.fixture
+def store(web_gui, monkeypatch, tmp_path):
+    """清空问题存储并把容量设为2"""
+    monkeypatch.setattr(web_gui, 'MAX_PROBLEMS', 2)
+    web_gui.active_problems.clear()
+    yield web_gui
+    web_gui.active_problems.clear()
+
+
+def make_problem(tmp_path, problem_id):
+    filepath = tmp_path / f"{problem_id}.mps"
+    filepath.write_text("NAME\n")
+    return {'id': problem_id, 'filepath': str(filepath), 'model': None}
+
+
+def test_lru_eviction(store, tmp_path):
+    """超出MAX_PROBLEMS时淘汰最久未使用的问题并删除其上传文件"""
+    problems = [make_problem(tmp_path, f"p{i}") for i in range(4)]
+    store.add_problem(problems[0])
+    store.add_problem(problems[1])
+    store.add_problem(problems[2])
+    assert list(store.active_problems) == ['p1', 'p2']
+    assert not os.path.exists(problems[0]['filepath'])
+
+    # 访问p1使其成为最近使用，再加入问题时淘汰p2
+    assert store.get_problem('p1') is problems[1]
+    store.add_problem(problems[3])
+    assert list(store.active_problems) == ['p1', 'p3']
+    assert store.get_problem('p2') is None
+    assert not os.path.exists(problems[2]['filepath'])
+    assert os.path.exists(problems[1]['filepath'])
+
+
+def test_shared_upload_file_is_kept(store, tmp_path):
+    """同名上传文件仍被其他问题使用时不删除"""
+    first = make_problem(tmp_path, 'a')
+    second = dict(make_problem(tmp_path, 'b'), filepath=first['filepath'])
+    store.add_problem(first)
+    store.add_problem(second)
+    assert store.remove_problem('a')
+    assert os.path.exists(first['filepath'])
+    assert store.remove_problem('b')
+    assert not os.path.exists(first['filepath'])
+    assert not store.remove_problem('b')
+
+
+def test_upload_and_delete(store):
+    """上传后可以求解，删除后问题和上传文件都不再存在"""
+    client = store.app.test_client()
+    with open(MPS_FILE, 'rb') as f:
+        data = f.read()
+    response = client.post('/api/upload', data={'file': (io.BytesIO(data), 'bk4x3.mps')},
+                           content_type='multipart/form-data')
+    result = response.get_json()
+    assert result['success'], result
+    problem_id = result['problem_id']
+    filepath = store.get_problem(problem_id)['filepath']
+    assert os.path.exists(filepath)
+
+    # 再次上传同名文件得到不同的问题ID，两者共用同一个上传文件
+    response = client.post('/api/upload', data={'file': (io.BytesIO(data), 'bk4x3.mps')},
+                           content_type='multipart/form-data')
+    other_id = response.get_json()['problem_id']
+    assert other_id != problem_id
+
+    assert client.delete(f'/api/problems/{problem_id}').status_code == 200
+    assert client.delete(f'/api/problems/{problem_id}').status_code == 404
+    assert store.get_problem(problem_id) is None
+    response = client.post('/api/solve', json={'problem_id': problem_id, 'solver': 'branch_bound'})
+    assert not response.get_json()['success']
+    assert os.path.exists(filepath)
+
+    assert client.delete(f'/api/problems/{other_id}').status_code == 200
+    assert not os.path.exists(filepath)